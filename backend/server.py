@@ -1,27 +1,41 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, File, UploadFile, Form
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, File, UploadFile, Form, Request, Query
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne, DeleteMany
+from pymongo.errors import DuplicateKeyError, BulkWriteError
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, Awaitable, Tuple, Union, AsyncIterator, AsyncIterable
 import uuid
 from datetime import datetime, timezone, timedelta
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 import asyncio
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 from functools import lru_cache
 import bcrypt
 import jwt
 from PIL import Image
 import io
 import base64
+import codecs
+import unicodedata
+import hashlib
+import tempfile
 import rispy
 import json
+from email.utils import parsedate_to_datetime
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -40,12 +54,24 @@ db = client[os.environ['DB_NAME']]
 uploads_dir = ROOT_DIR / 'uploads'
 uploads_dir.mkdir(exist_ok=True)
 
+# Uploaded files are never modified in place (every upload gets a new name), so browsers and
+# proxies may cache them for a year
+UPLOAD_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+UPLOAD_FILENAME_PATTERN = re.compile(r'^[\w-]+\.(jpg|webp)$')
+
+def upload_url(filename: str) -> str:
+    """Public URL of a file in the uploads directory"""
+    return f"/api/uploads/{filename}"
+
 # Create the main app without a prefix
 app = FastAPI()
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
+# Largest page a list endpoint will return
+MAX_PAGE_SIZE = 500
+
 # Security
 security = HTTPBearer()
 
@@ -114,6 +140,7 @@ class TeamMember(BaseModel):
     email: str
     bio: str
     photo_url: Optional[str] = None
+    photo_srcset: Optional[Dict[str, str]] = None  # Filled in when served, from image_assets
     scopus_id: Optional[str] = None
     google_scholar: Optional[str] = None
     orcid: Optional[str] = None
@@ -164,7 +191,7 @@ class ResearchArea(BaseModel):
     keywords: List[str] = []
     sdgs: List[int] = []
     image_url: Optional[str] = None
-    image_url: Optional[str] = None
+    image_srcset: Optional[Dict[str, str]] = None  # Filled in when served, from image_assets
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class IntellectualProperty(BaseModel):
@@ -181,6 +208,7 @@ class ResearchHighlight(BaseModel):
     title: str
     description: str
     image_url: Optional[str] = None
+    image_srcset: Optional[Dict[str, str]] = None  # Filled in when served, from image_assets
     link_url: Optional[str] = None
     is_featured: bool = False
     order_index: int = 0
@@ -207,6 +235,7 @@ class NewsArticle(BaseModel):
     content: str
     author: str
     image_url: Optional[str] = None
+    image_srcset: Optional[Dict[str, str]] = None  # Filled in when served, from image_assets
     is_featured: bool = False
     is_published: bool = True
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -255,6 +284,15 @@ class CitationMetrics(BaseModel):
     i10_index: int
     last_updated: datetime
 
+class MemberMetrics(BaseModel):
+    member_id: str
+    name: str
+    source: str  # "google_scholar" or "scopus"
+    total_citations: int
+    h_index: int
+    i10_index: Optional[int] = None
+    last_updated: datetime
+
 # Utility functions
 def hash_password(password: str) -> str:
     return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
@@ -301,61 +339,1036 @@ async def get_super_admin_user(current_user: User = Depends(get_current_user)):
         raise HTTPException(status_code=403, detail="Super admin access required")
     return current_user
 
-def resize_image(image_data: bytes, max_width: int = 800, max_height: int = 600, quality: int = 85) -> bytes:
-    """Resize image while maintaining aspect ratio"""
+def load_image_rgb(source: Union[bytes, str], min_width: Optional[int] = None, min_height: Optional[int] = None) -> Image.Image:
+    """Open an image (bytes or file path) and flatten transparency onto white so it can be saved as JPEG.
+    
+    With min_width/min_height, JPEGs are decoded in draft mode at the smallest DCT scale
+    (1/2, 1/4, 1/8) still at least that large, so decode time and memory follow the output size.
+    """
+    image = Image.open(io.BytesIO(source) if isinstance(source, bytes) else source)
+    if image.format == 'JPEG' and min_width and min_height:
+        scale = max(min_width / image.width, min_height / image.height)
+        if scale < 1:
+            image.draft('RGB', (int(image.width * scale), int(image.height * scale)))
+    
+    # Convert to RGB if necessary
+    if image.mode in ('RGBA', 'LA', 'P'):
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        if image.mode == 'P':
+            image = image.convert('RGBA')
+        background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
+        image = background
+    elif image.mode != 'RGB':
+        image = image.convert('RGB')
+    return image
+
+def fit_image(image: Image.Image, max_width: int, max_height: int) -> Image.Image:
+    """Scale an image down to fit within max_width x max_height, keeping its aspect ratio"""
+    width, height = image.size
+    ratio = min(max_width/width, max_height/height)
+    
+    if ratio < 1:
+        new_width = max(1, int(width * ratio))
+        new_height = max(1, int(height * ratio))
+        # reducing_gap lets Pillow box-reduce by an integer factor before the LANCZOS pass
+        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+    return image
+
+def encode_image(image: Image.Image, fmt: str = 'jpeg', quality: int = 85) -> bytes:
+    """Encode an image as JPEG or WebP"""
+    output = io.BytesIO()
+    if fmt == 'webp':
+        image.save(output, format='WEBP', quality=quality, method=4)
+    else:
+        image.save(output, format='JPEG', quality=quality, optimize=True)
+    return output.getvalue()
+
+def image_size(source: Union[bytes, str]) -> Tuple[int, int]:
+    """Width and height of an image (bytes or file path), read from its header only"""
+    with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as probe:
+        return probe.size
+
+def resize_image(source: Union[bytes, str], max_width: int = 800, max_height: int = 600, quality: int = 85, fmt: str = 'jpeg') -> bytes:
+    """Resize image (bytes or file path) while maintaining aspect ratio, encoded as JPEG or WebP.
+    
+    Raises ValueError if it cannot be processed. CPU-bound: call it through an ImageWorkQueue
+    so it runs in a worker pool.
+    """
     try:
-        image = Image.open(io.BytesIO(image_data))
-        
-        # Convert to RGB if necessary
-        if image.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            if image.mode == 'P':
-                image = image.convert('RGBA')
-            background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
-            image = background
-        
-        # Calculate new dimensions
-        width, height = image.size
-        ratio = min(max_width/width, max_height/height)
+        width, height = image_size(source)
+        ratio = min(1, max_width / width, max_height / height)
+        image = load_image_rgb(source, int(width * ratio), int(height * ratio))
+        return encode_image(fit_image(image, max_width, max_height), fmt, quality)
+    except Exception as e:
+        raise ValueError(str(e))
+
+# Responsive variants generated for every upload (widths in px; never upscaled). Each variant is
+# bounded by the upload's box scaled to that width, so tall images don't get full-height variants.
+IMAGE_VARIANT_WIDTHS = [int(w) for w in os.environ.get('IMAGE_VARIANT_WIDTHS', '160,480,800,1600').split(',')]
+IMAGE_VARIANT_FORMATS = {'jpeg': 'jpg', 'webp': 'webp'}
+
+def render_image_variants(source: Union[bytes, str], max_width: int = 800, max_height: int = 600, quality: int = 85) -> dict:
+    """Decode an upload (bytes or file path) once and render the main JPEG plus the responsive JPEG/WebP variants.
+    
+    CPU-bound: call it through an ImageWorkQueue so it runs in a worker pool.
+    """
+    try:
+        # Decode just large enough for the biggest output: the main image or the largest variant
+        width, height = image_size(source)
+        aspect = max_height / max_width
+        largest = max(IMAGE_VARIANT_WIDTHS)
+        needed = max(min(1, max_width / width, max_height / height), min(1, largest / width, largest * aspect / height))
+        image = load_image_rgb(source, int(width * needed), int(height * needed))
+        main = fit_image(image, max_width, max_height)
         
-        if ratio < 1:
-            new_width = int(width * ratio)
-            new_height = int(height * ratio)
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        variants = []
+        scaled = image
+        sizes = set()
+        for variant_width in sorted(IMAGE_VARIANT_WIDTHS, reverse=True):
+            # Downscale from the previous (larger) variant rather than the full-size original
+            scaled = fit_image(scaled, variant_width, max(1, round(variant_width * aspect)))
+            if scaled.size in sizes:
+                continue
+            sizes.add(scaled.size)
+            for fmt in IMAGE_VARIANT_FORMATS:
+                variants.append({'width': scaled.width, 'height': scaled.height, 'format': fmt, 'data': encode_image(scaled, fmt, quality)})
         
-        # Save to bytes
-        output = io.BytesIO()
-        image.save(output, format='JPEG', quality=quality, optimize=True)
-        return output.getvalue()
+        return {
+            'main': encode_image(main, 'jpeg', quality),
+            'width': main.width,
+            'height': main.height,
+            'variants': sorted(variants, key=lambda v: v['width'])
+        }
     except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Image processing failed: {str(e)}")
+        raise ValueError(str(e))
+
+# Image processing runs in small process pools so resizes never block the event loop. Admin
+# uploads and public on-demand transforms get separate pools and limits, so a burst of transform
+# requests can't starve uploads; once a queue's limit of running or waiting jobs is reached,
+# new requests get 503 + Retry-After
+IMAGE_WORKERS = int(os.environ.get('IMAGE_WORKERS', '2'))
+IMAGE_QUEUE_LIMIT = int(os.environ.get('IMAGE_QUEUE_LIMIT', '8'))
+IMAGE_TRANSFORM_WORKERS = int(os.environ.get('IMAGE_TRANSFORM_CONCURRENCY', '2'))
+IMAGE_TRANSFORM_QUEUE_LIMIT = int(os.environ.get('IMAGE_TRANSFORM_QUEUE_LIMIT', '16'))
+IMAGE_RETRY_AFTER_SECONDS = int(os.environ.get('IMAGE_RETRY_AFTER_SECONDS', '5'))
+
+class ImageWorkQueue:
+    """A lazily started process pool with a cap on running plus waiting jobs.
+    
+    Workers are spawned rather than forked: forking the multithreaded server process
+    (Motor, uvicorn) can copy locks held by other threads into the child.
+    """
+    
+    def __init__(self, name: str, workers: int, limit: int):
+        self.name = name
+        self.workers = workers
+        self.limit = limit
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.jobs = 0
+    
+    def get_pool(self) -> ProcessPoolExecutor:
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+        return self.pool
+    
+    def replace_broken_pool(self, pool: ProcessPoolExecutor):
+        """Drop a pool whose worker died so the next job starts a fresh one"""
+        if self.pool is pool:
+            self.pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+    
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        """Run an image function in the pool (503 when saturated, 400 for unreadable images)"""
+        if self.jobs >= self.limit:
+            raise HTTPException(
+                status_code=503,
+                detail="Image processing is busy, please retry shortly",
+                headers={'Retry-After': str(IMAGE_RETRY_AFTER_SECONDS)}
+            )
+        
+        self.jobs += 1
+        pool = self.get_pool()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            # A worker was killed (out of memory, or a crash in the image decoder)
+            logging.error(f"Image {self.name} worker pool broke, starting a new one")
+            self.replace_broken_pool(pool)
+            raise HTTPException(
+                status_code=503,
+                detail="Image processing failed, please retry shortly",
+                headers={'Retry-After': str(IMAGE_RETRY_AFTER_SECONDS)}
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Image processing failed: {str(e)}")
+        finally:
+            self.jobs -= 1
+
+upload_image_queue = ImageWorkQueue('upload', IMAGE_WORKERS, IMAGE_QUEUE_LIMIT)
+transform_image_queue = ImageWorkQueue('transform', IMAGE_TRANSFORM_WORKERS, IMAGE_TRANSFORM_QUEUE_LIMIT)
+
+def ris_value(entry: dict, key: str) -> str:
+    """First value of a RIS field (rispy returns lists for repeatable tags, strings otherwise)"""
+    value = entry.get(key)
+    if isinstance(value, list):
+        value = value[0] if value else ''
+    return str(value).strip() if value else ''
+
+def ris_entry_to_publication(entry: dict) -> dict:
+    """Map a parsed RIS entry to our publication fields"""
+    year_match = re.match(r'\d{4}', ris_value(entry, 'year') or ris_value(entry, 'publication_year'))
+    pages = ris_value(entry, 'start_page')
+    if pages and ris_value(entry, 'end_page'):
+        pages = f"{pages}-{ris_value(entry, 'end_page')}"
+    
+    return {
+        'title': ris_value(entry, 'title') or ris_value(entry, 'primary_title'),
+        'authors': ', '.join(entry.get('authors', []) or entry.get('first_authors', [])),
+        'journal': ris_value(entry, 'journal_name') or ris_value(entry, 'secondary_title'),
+        'year': int(year_match.group(0)) if year_match else 0,
+        'volume': ris_value(entry, 'volume'),
+        'issue': ris_value(entry, 'number'),
+        'pages': pages,
+        'doi': ris_value(entry, 'doi'),
+        'abstract': ris_value(entry, 'abstract'),
+        'keywords': entry.get('keywords', []),
+        'publication_type': entry.get('type_of_reference', 'journal_article')
+    }
 
 def parse_ris_file(file_content: str) -> List[dict]:
     """Parse RIS file and extract publication data"""
     try:
-        entries = rispy.loads(file_content)
-        publications = []
+        publications = [ris_entry_to_publication(entry) for entry in rispy.loads(file_content)]
+        return [pub for pub in publications if pub['title']]  # Only add if title exists
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"RIS file parsing failed: {str(e)}")
+
+RIS_READ_CHUNK_BYTES = 64 * 1024
+RIS_END_OF_RECORD = re.compile(r'^ER\s{1,2}-')
+
+async def iter_ris_records(file: UploadFile, errors: Optional[List[str]] = None) -> AsyncIterator[dict]:
+    """Yield publications from an uploaded RIS file one record at a time, reading it in chunks.
+    
+    Only the current chunk and record are held in memory. Malformed records are skipped and
+    described in errors (if given); records without a title are dropped as in parse_ris_file.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+    pending = ''
+    record_lines: List[str] = []
+    record_number = 0
+    
+    while True:
+        chunk = await file.read(RIS_READ_CHUNK_BYTES)
+        pending += decoder.decode(chunk, final=not chunk)
+        lines = pending.split('\n')
+        # Keep the last, possibly incomplete line for the next chunk
+        pending = lines.pop() if chunk else ''
         
-        for entry in entries:
-            pub = {
-                'title': entry.get('title', [''])[0] if entry.get('title') else '',
-                'authors': ', '.join(entry.get('authors', [])),
-                'journal': entry.get('journal_name', [''])[0] if entry.get('journal_name') else '',
-                'year': int(entry.get('year', [0])[0]) if entry.get('year') and entry.get('year')[0] else 0,
-                'volume': entry.get('volume', [''])[0] if entry.get('volume') else '',
-                'issue': entry.get('number', [''])[0] if entry.get('number') else '',
-                'pages': entry.get('start_page', [''])[0] if entry.get('start_page') else '',
-                'doi': entry.get('doi', [''])[0] if entry.get('doi') else '',
-                'abstract': entry.get('abstract', [''])[0] if entry.get('abstract') else '',
-                'keywords': entry.get('keywords', []),
-                'publication_type': entry.get('type_of_reference', 'journal_article')
-            }
-            if pub['title']:  # Only add if title exists
-                publications.append(pub)
+        for line in lines:
+            line = line.rstrip('\r')
+            record_lines.append(line)
+            if not RIS_END_OF_RECORD.match(line):
+                continue
+            
+            record_number += 1
+            record_text = '\n'.join(record_lines) + '\n'
+            record_lines = []
+            try:
+                entries = rispy.loads(record_text)
+            except Exception as e:
+                if errors is not None:
+                    errors.append(f"Record {record_number}: {e}")
+                continue
+            for entry in entries:
+                pub = ris_entry_to_publication(entry)
+                if pub['title']:
+                    yield pub
         
-        return publications
+        if not chunk:
+            break
+
+async def iter_text_chunks(file: UploadFile) -> AsyncIterator[str]:
+    """Decoded text of an uploaded file, one chunk at a time (UTF-8, BOM stripped)"""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+    while True:
+        chunk = await file.read(RIS_READ_CHUNK_BYTES)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            yield text
+        if not chunk:
+            break
+
+# BibTeX and CSL-JSON records are mapped onto rispy's entry fields, so every import format
+# shares ris_entry_to_publication (and exports use the reverse of the same mapping)
+BIBTEX_TO_RIS_TYPE = {
+    'article': 'JOUR', 'book': 'BOOK', 'inbook': 'CHAP', 'incollection': 'CHAP',
+    'inproceedings': 'CONF', 'conference': 'CONF', 'phdthesis': 'THES', 'mastersthesis': 'THES',
+    'techreport': 'RPRT', 'misc': 'GEN', 'unpublished': 'UNPB'
+}
+RIS_TO_BIBTEX_TYPE = {'JOUR': 'article', 'BOOK': 'book', 'CHAP': 'incollection', 'CONF': 'inproceedings', 'CPAPER': 'inproceedings', 'THES': 'phdthesis', 'RPRT': 'techreport', 'UNPB': 'unpublished', 'journal_article': 'article'}
+CSL_TO_RIS_TYPE = {
+    'article-journal': 'JOUR', 'article': 'JOUR', 'book': 'BOOK', 'chapter': 'CHAP',
+    'paper-conference': 'CONF', 'thesis': 'THES', 'report': 'RPRT', 'manuscript': 'UNPB'
+}
+RIS_TO_CSL_TYPE = {'JOUR': 'article-journal', 'BOOK': 'book', 'CHAP': 'chapter', 'CONF': 'paper-conference', 'CPAPER': 'paper-conference', 'THES': 'thesis', 'RPRT': 'report', 'UNPB': 'manuscript', 'journal_article': 'article-journal'}
+BIBTEX_ENTRY_START = re.compile(r'@\s*(\w+)\s*([{(])')
+BIBTEX_SKIPPED_TYPES = {'comment', 'preamble', 'string'}
+
+def split_page_range(pages: str) -> Tuple[str, str]:
+    parts = re.split(r'\s*[-\u2013]+\s*', (pages or '').strip(), maxsplit=1)
+    return parts[0], parts[1] if len(parts) > 1 else ''
+
+def find_closing_brace(text: str, brace_start: int) -> Optional[int]:
+    """Index just past the brace matching the one at brace_start (None if not in text yet)"""
+    depth = 0
+    for index in range(brace_start, len(text)):
+        char = text[index]
+        if char == '{' and text[index - 1] != '\\':
+            depth += 1
+        elif char == '}' and text[index - 1] != '\\':
+            depth -= 1
+            if depth == 0:
+                return index + 1
+    return None
+
+def find_entry_end(text: str, start: int) -> Optional[int]:
+    """Index just past the delimiter closing the entry opened at start, "{" or "(" (None if not in text yet)"""
+    if text[start] == '{':
+        return find_closing_brace(text, start)
+    # @type(...) entries: only parens outside braced and quoted values count
+    braces = parens = 0
+    quoted = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if text[index - 1] == '\\':
+            continue
+        if char == '{':
+            braces += 1
+        elif char == '}':
+            braces -= 1
+        elif braces == 0 and char == '"':
+            quoted = not quoted
+        elif braces == 0 and not quoted and char in '()':
+            parens += 1 if char == '(' else -1
+            if parens == 0:
+                return index + 1
+    return None
+
+def clean_bibtex_value(value: str) -> str:
+    value = re.sub(r'\\([&%$#_{}])', r'\1', value)
+    return ' '.join(value.replace('{', '').replace('}', '').split())
+
+def parse_bibtex_fields(body: str) -> Dict[str, str]:
+    """Fields of a BibTeX entry body (the text after the citation key), lower-cased names"""
+    fields = {}
+    index = 0
+    while index < len(body):
+        match = re.compile(r'[\s,]*([\w:.-]+)\s*=\s*').match(body, index)
+        if not match:
+            break
+        name, index = match.group(1).lower(), match.end()
+        parts = []
+        while index < len(body):
+            char = body[index]
+            if char == '{':
+                end = find_closing_brace(body, index)
+                if end is None:
+                    raise ValueError(f"Unbalanced braces in field {name}")
+                parts.append(body[index + 1:end - 1])
+                index = end
+            elif char == '"':
+                end = index + 1
+                depth = 0
+                while end < len(body) and not (body[end] == '"' and depth == 0 and body[end - 1] != '\\'):
+                    depth += {'{': 1, '}': -1}.get(body[end], 0)
+                    end += 1
+                parts.append(body[index + 1:end])
+                index = end + 1
+            else:
+                bare = re.compile(r'[^,#\s}]+').match(body, index)
+                if not bare:
+                    break
+                parts.append(bare.group(0))
+                index = bare.end()
+            concat = re.compile(r'\s*#\s*').match(body, index)
+            if not concat:
+                break
+            index = concat.end()
+        fields[name] = clean_bibtex_value(''.join(parts))
+    return fields
+
+def bibtex_entry_to_publication(entry_type: str, fields: Dict[str, str]) -> dict:
+    start_page, end_page = split_page_range(fields.get('pages', ''))
+    return ris_entry_to_publication({
+        'type_of_reference': BIBTEX_TO_RIS_TYPE.get(entry_type, 'GEN'),
+        'title': fields.get('title', ''),
+        'authors': [name.strip() for name in re.split(r'\s+and\s+', fields.get('author', '')) if name.strip()],
+        'journal_name': fields.get('journal') or fields.get('booktitle', ''),
+        'year': fields.get('year', ''),
+        'volume': fields.get('volume', ''),
+        'number': fields.get('number', ''),
+        'start_page': start_page,
+        'end_page': end_page,
+        'doi': fields.get('doi', ''),
+        'abstract': fields.get('abstract', ''),
+        'keywords': [k.strip() for k in re.split(r'[,;]', fields.get('keywords', '')) if k.strip()]
+    })
+
+async def iter_bibtex_records(file: UploadFile, errors: Optional[List[str]] = None) -> AsyncIterator[dict]:
+    """Yield publications from an uploaded BibTeX file one entry at a time, reading it in chunks.
+    
+    Entries may be delimited by @type{...} or @type(...) and text outside them is treated as a
+    comment; @comment, @preamble and @string entries are skipped (string macros are not expanded).
+    """
+    buffer = ''
+    entry_number = 0
+    async for text in iter_text_chunks(file):
+        buffer += text
+        while True:
+            at = buffer.find('@')
+            if at < 0:
+                buffer = ''
+                break
+            match = BIBTEX_ENTRY_START.match(buffer, at)
+            if not match:
+                # Either a stray "@" in comment text, or an entry header split across chunks
+                if re.fullmatch(r'@\s*\w*\s*', buffer[at:]):
+                    buffer = buffer[at:]
+                    break
+                buffer = buffer[at + 1:]
+                continue
+            end = find_entry_end(buffer, match.end() - 1)
+            if end is None:
+                buffer = buffer[at:]
+                break
+            
+            entry_type = match.group(1).lower()
+            body = buffer[match.end():end - 1]
+            buffer = buffer[end:]
+            if entry_type in BIBTEX_SKIPPED_TYPES:
+                continue
+            
+            entry_number += 1
+            try:
+                _, _, field_text = body.partition(',')
+                pub = bibtex_entry_to_publication(entry_type, parse_bibtex_fields(field_text))
+            except ValueError as e:
+                if errors is not None:
+                    errors.append(f"Entry {entry_number}: {e}")
+                continue
+            if pub['title']:
+                yield pub
+    
+    if buffer.strip() and errors is not None:
+        errors.append("File ends inside an unterminated entry")
+
+def csl_item_to_publication(item: dict) -> dict:
+    authors = []
+    for name in item.get('author', []):
+        if name.get('family'):
+            authors.append(f"{name['family']}, {name['given']}" if name.get('given') else name['family'])
+        elif name.get('literal'):
+            authors.append(name['literal'])
+    date_parts = (item.get('issued') or {}).get('date-parts') or [[]]
+    start_page, end_page = split_page_range(str(item.get('page', '')))
+    keywords = item.get('keyword', '')
+    
+    return ris_entry_to_publication({
+        'type_of_reference': CSL_TO_RIS_TYPE.get(item.get('type', ''), 'GEN'),
+        'title': item.get('title', ''),
+        'authors': authors,
+        'journal_name': item.get('container-title', ''),
+        'year': str(date_parts[0][0]) if date_parts[0] else '',
+        'volume': str(item.get('volume', '')),
+        'number': str(item.get('issue', '')),
+        'start_page': start_page,
+        'end_page': end_page,
+        'doi': item.get('DOI', ''),
+        'abstract': item.get('abstract', ''),
+        'keywords': [k.strip() for k in re.split(r'[,;]', keywords) if k.strip()] if isinstance(keywords, str) else list(keywords)
+    })
+
+CSL_MAX_ITEM_CHARS = 1024 * 1024
+
+def skip_json_value(text: str, start: int, state: dict) -> Optional[int]:
+    """Index where the (malformed) array item at start ends: the next top-level "," or "]", or
+    just past its closing "}". None if text runs out first; state carries the scan to the next chunk.
+    """
+    for index in range(start, len(text)):
+        char = text[index]
+        if state['in_string']:
+            if state['escape']:
+                state['escape'] = False
+            elif char == '\\':
+                state['escape'] = True
+            elif char == '"':
+                state['in_string'] = False
+        elif char == '"':
+            state['in_string'] = True
+        elif char in '{[':
+            state['depth'] += 1
+        elif char in '}]':
+            state['depth'] -= 1
+            if state['depth'] == 0 and char == '}':
+                return index + 1
+            if state['depth'] < 0:
+                return index
+        elif char == ',' and state['depth'] == 0:
+            return index
+    return None
+
+async def iter_csl_json_records(file: UploadFile, errors: Optional[List[str]] = None) -> AsyncIterator[dict]:
+    """Yield publications from an uploaded CSL-JSON array one item at a time, reading it in chunks.
+    
+    An item that fails to decode is only waited on while more input is coming and it is under
+    CSL_MAX_ITEM_CHARS; otherwise it is reported in errors (if given) and skipped.
+    """
+    decoder = json.JSONDecoder()
+    chunks = iter_text_chunks(file)
+    buffer = ''
+    started = finished = final = False
+    skipping = None
+    item_number = 0
+    
+    while not (finished or final):
+        try:
+            buffer += await chunks.__anext__()
+        except StopAsyncIteration:
+            final = True
+        index = 0
+        while not finished:
+            if skipping is not None:
+                end = skip_json_value(buffer, index, skipping)
+                if end is None:
+                    index = len(buffer)
+                    break
+                index, skipping = end, None
+            while index < len(buffer) and (buffer[index].isspace() or (started and buffer[index] == ',')):
+                index += 1
+            if index >= len(buffer):
+                break
+            if not started:
+                if buffer[index] != '[':
+                    raise ValueError("CSL-JSON must be an array of items")
+                started = True
+                index += 1
+                continue
+            if buffer[index] == ']':
+                finished = True
+                break
+            try:
+                item, index = decoder.raw_decode(buffer, index)
+            except json.JSONDecodeError as e:
+                if not final and len(buffer) - index < CSL_MAX_ITEM_CHARS:
+                    # The item probably continues in the next chunk
+                    break
+                item_number += 1
+                if errors is not None:
+                    errors.append(f"Item {item_number}: invalid JSON ({e.msg})")
+                skipping = {'depth': 0, 'in_string': False, 'escape': False}
+                continue
+            
+            item_number += 1
+            if not isinstance(item, dict):
+                if errors is not None:
+                    errors.append(f"Item {item_number}: not an object")
+                continue
+            pub = csl_item_to_publication(item)
+            if pub['title']:
+                yield pub
+        buffer = buffer[index:]
+    
+    if not finished and errors is not None:
+        errors.append("File ends before the closing ] of the CSL-JSON array")
+
+def split_authors(authors: str) -> List[str]:
+    """Best-effort split of a stored author string back into names.
+    
+    RIS imports join "Last, First" names with ", ", so parts are paired back up when every
+    other part is a single-word family name; otherwise each part is taken as a full name.
+    """
+    if ';' in authors:
+        return [name.strip() for name in authors.split(';') if name.strip()]
+    parts = [part.strip() for part in (authors or '').split(',') if part.strip()]
+    if len(parts) % 2 == 0 and all(len(parts[i].split()) == 1 for i in range(0, len(parts), 2)):
+        return [f"{parts[i]}, {parts[i + 1]}" for i in range(0, len(parts), 2)]
+    return parts
+
+def bibtex_escape(value: Any) -> str:
+    return re.sub(r'([&%$#_{}])', r'\\\1', str(value))
+
+def publication_to_bibtex(pub: dict) -> str:
+    """Render a stored publication as a BibTeX entry"""
+    entry_type = RIS_TO_BIBTEX_TYPE.get(pub.get('publication_type'), 'misc')
+    authors = split_authors(pub.get('authors', ''))
+    surname = authors[0].split(',')[0] if authors and ',' in authors[0] else (authors[0].split()[-1] if authors else 'anon')
+    surname = re.sub(r'[^a-z]', '', unicodedata.normalize('NFKD', surname).encode('ascii', 'ignore').decode().lower()) or 'anon'
+    key = f"{surname}{pub.get('year') or ''}_{str(pub.get('id', ''))[:8]}"
+    
+    container = 'booktitle' if entry_type in ('inproceedings', 'incollection') else 'journal'
+    fields = [
+        ('title', pub.get('title')),
+        ('author', ' and '.join(authors)),
+        (container, pub.get('journal')),
+        ('year', pub.get('year') or ''),
+        ('volume', pub.get('volume')),
+        ('number', pub.get('issue')),
+        ('pages', re.sub(r'\s*-+\s*', '--', pub.get('pages') or '')),
+        ('doi', pub.get('doi')),
+        ('abstract', pub.get('abstract')),
+        ('keywords', ', '.join(pub.get('keywords') or []))
+    ]
+    lines = [f"  {name} = {{{bibtex_escape(value)}}}" for name, value in fields if value]
+    return f"@{entry_type}{{{key},\n" + ',\n'.join(lines) + "\n}"
+
+def publication_to_csl(pub: dict) -> dict:
+    """Render a stored publication as a CSL-JSON item"""
+    item = {'id': pub.get('id'), 'type': RIS_TO_CSL_TYPE.get(pub.get('publication_type'), 'article'), 'title': pub.get('title')}
+    names = []
+    for name in split_authors(pub.get('authors', '')):
+        family, _, given = name.partition(',')
+        names.append({'family': family.strip(), 'given': given.strip()} if given else {'literal': name})
+    optional = {
+        'author': names,
+        'container-title': pub.get('journal'),
+        'issued': {'date-parts': [[pub['year']]]} if pub.get('year') else None,
+        'volume': pub.get('volume'),
+        'issue': pub.get('issue'),
+        'page': pub.get('pages'),
+        'DOI': pub.get('doi'),
+        'abstract': pub.get('abstract'),
+        'keyword': ', '.join(pub.get('keywords') or [])
+    }
+    item.update({key: value for key, value in optional.items() if value})
+    return item
+
+# Export formats: media type and file extension
+PUBLICATION_EXPORT_FORMATS = {
+    'bibtex': ('application/x-bibtex; charset=utf-8', 'bib'),
+    'csl-json': ('application/vnd.citationstyles.csl+json; charset=utf-8', 'json')
+}
+
+async def stream_publications_export(fmt: str) -> AsyncIterator[str]:
+    """Stream static_publications as BibTeX or a CSL-JSON array straight from a MongoDB cursor"""
+    cursor = db.static_publications.find({}, {'_id': 0, 'minhash': 0, 'lsh_bands': 0}).sort([('year', -1), ('title', 1)]).batch_size(200)
+    if fmt == 'csl-json':
+        yield '['
+    first = True
+    async for pub in cursor:
+        if fmt == 'bibtex':
+            yield publication_to_bibtex(pub) + '\n\n'
+        else:
+            yield ('\n' if first else ',\n') + json.dumps(publication_to_csl(pub), ensure_ascii=False, default=str)
+        first = False
+    if fmt == 'csl-json':
+        yield '\n]\n'
+
+# Publication dedup: a unique (partial) index on dedup_key, the normalized title + year,
+# plus a lookup on the normalized DOI when a record has one
+RIS_IMPORT_BATCH_SIZE = int(os.environ.get('RIS_IMPORT_BATCH_SIZE', '500'))
+DASH_CHARACTERS = re.compile(r'[\u2010-\u2015\u2212\ufe58\ufe63\uff0d]')
+
+def normalize_title(title: str) -> str:
+    """Title folded for comparison: NFKC, case-folded, unicode dashes unified, punctuation and extra spaces dropped"""
+    text = DASH_CHARACTERS.sub('-', unicodedata.normalize('NFKC', title or '')).casefold()
+    text = re.sub(r'[^\w\s-]', ' ', text)
+    return ' '.join(text.replace('-', ' ').split())
+
+def publication_dedup_key(pub: dict) -> str:
+    return f"{normalize_title(pub.get('title', ''))}|{pub.get('year') or 0}"
+
+def normalize_doi(doi: Optional[str]) -> str:
+    doi = (doi or '').strip().lower()
+    return re.sub(r'^(https?://(dx\.)?doi\.org/|doi:\s*)', '', doi)
+
+# Near-duplicate detection: MinHash signatures over title character 3-grams and author name
+# tokens, indexed with LSH banding (lsh_bands, multikey index) so candidates come from an index
+# lookup instead of a scan. 16 bands x 4 rows puts the 50% detection point near 0.5 Jaccard;
+# candidates are then confirmed against NEAR_DUPLICATE_THRESHOLD.
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+NEAR_DUPLICATE_THRESHOLD = float(os.environ.get('NEAR_DUPLICATE_THRESHOLD', '0.8'))
+MINHASH_PRIME = (1 << 61) - 1
+_minhash_random = random.Random(20240607)
+MINHASH_COEFFICIENTS = [
+    (_minhash_random.randrange(1, MINHASH_PRIME), _minhash_random.randrange(0, MINHASH_PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+]
+
+def publication_features(pub: dict) -> set:
+    """Shingles compared for near-duplicates: title 3-grams plus author name tokens"""
+    title = normalize_title(pub.get('title', ''))
+    features = {title[i:i + 3] for i in range(max(1, len(title) - 2))}
+    authors = normalize_title(pub.get('authors', ''))
+    features.update(f"au:{token}" for token in authors.split() if len(token) > 1)
+    return features
+
+def minhash_signature(features: set) -> List[int]:
+    hashes = [int.from_bytes(hashlib.blake2b(f.encode(), digest_size=8).digest(), 'big') for f in features] or [0]
+    return [min((a * h + b) % MINHASH_PRIME for h in hashes) for a, b in MINHASH_COEFFICIENTS]
+
+def lsh_bands(signature: List[int]) -> List[str]:
+    """One bucket key per band; publications sharing any bucket are candidate duplicates"""
+    return [
+        f"{band}:{hashlib.blake2b(repr(signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]).encode(), digest_size=8).hexdigest()}"
+        for band in range(LSH_BANDS)
+    ]
+
+def signature_similarity(a: List[int], b: List[int]) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures"""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+def near_duplicate_fields(pub: dict) -> dict:
+    signature = minhash_signature(publication_features(pub))
+    return {'minhash': signature, 'lsh_bands': lsh_bands(signature)}
+
+async def find_near_duplicates(records: List[dict]) -> Dict[int, Tuple[str, float]]:
+    """For records carrying minhash/lsh_bands, find the most similar stored publication above the
+    threshold (one indexed query for all of them); returns {record index: (publication id, similarity)}"""
+    bands = list({band for record in records for band in record['lsh_bands']})
+    if not bands:
+        return {}
+    
+    candidates = await db.static_publications.find(
+        {'lsh_bands': {'$in': bands}}, {'id': 1, 'minhash': 1, 'lsh_bands': 1}
+    ).to_list(None)
+    buckets: Dict[str, List[dict]] = {}
+    for candidate in candidates:
+        for band in candidate.get('lsh_bands', []):
+            buckets.setdefault(band, []).append(candidate)
+    
+    matches = {}
+    for index, record in enumerate(records):
+        best = None
+        for band in record['lsh_bands']:
+            for candidate in buckets.get(band, []):
+                similarity = signature_similarity(record['minhash'], candidate['minhash'])
+                if similarity >= NEAR_DUPLICATE_THRESHOLD and (best is None or similarity > best[1]):
+                    best = (candidate['id'], similarity)
+        if best:
+            matches[index] = best
+    return matches
+
+async def find_duplicate_clusters(threshold: float = NEAR_DUPLICATE_THRESHOLD, max_bucket_size: int = 200) -> List[dict]:
+    """Group stored publications into clusters of likely duplicates.
+    
+    Candidate pairs come from shared LSH buckets (grouped in MongoDB), are confirmed by signature
+    similarity and joined with union-find. Oversized buckets (e.g. boilerplate titles) are skipped.
+    """
+    buckets = await db.static_publications.aggregate([
+        {'$unwind': '$lsh_bands'},
+        {'$group': {'_id': '$lsh_bands', 'ids': {'$addToSet': '$id'}}},
+        {'$match': {'ids.1': {'$exists': True}}}
+    ]).to_list(None)
+    
+    pairs = set()
+    for bucket in buckets:
+        ids = sorted(bucket['ids'])
+        if len(ids) <= max_bucket_size:
+            pairs.update((a, b) for i, a in enumerate(ids) for b in ids[i + 1:])
+    if not pairs:
+        return []
+    
+    involved = {pid for pair in pairs for pid in pair}
+    projection = {'id': 1, 'title': 1, 'authors': 1, 'year': 1, 'doi': 1, 'minhash': 1}
+    publications = {pub['id']: pub for pub in await db.static_publications.find({'id': {'$in': list(involved)}}, projection).to_list(None)}
+    
+    parent = {}
+    def find(pid: str) -> str:
+        while parent.get(pid, pid) != pid:
+            pid = parent[pid]
+        return pid
+    
+    best_similarity: Dict[str, float] = {}
+    for a, b in pairs:
+        if a not in publications or b not in publications:
+            continue
+        similarity = signature_similarity(publications[a]['minhash'], publications[b]['minhash'])
+        if similarity >= threshold:
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[root_b] = root_a
+            for pid in (a, b):
+                best_similarity[pid] = max(best_similarity.get(pid, 0), similarity)
+    
+    clusters: Dict[str, List[str]] = {}
+    for pid in best_similarity:
+        clusters.setdefault(find(pid), []).append(pid)
+    
+    report = []
+    for members in clusters.values():
+        report.append({
+            'size': len(members),
+            'max_similarity': round(max(best_similarity[pid] for pid in members), 2),
+            'publications': [
+                {key: publications[pid].get(key) for key in ('id', 'title', 'authors', 'year', 'doi')}
+                for pid in sorted(members, key=lambda pid: publications[pid].get('year') or 0)
+            ]
+        })
+    report.sort(key=lambda cluster: (-cluster['size'], -cluster['max_similarity']))
+    return report
+
+async def import_publications(publications: Union[List[dict], AsyncIterable[dict]], on_batch: Optional[Callable[[dict], Awaitable[None]]] = None) -> dict:
+    """Insert new publications into static_publications with batched bulk upserts.
+    
+    Works through a list or an async stream of records in batches of RIS_IMPORT_BATCH_SIZE, so a
+    streamed import holds one batch at a time. Records already present (same normalized title +
+    year, or same DOI) are matched and left untouched; untitled records and repeats within a
+    batch are skipped. New records that closely resemble a stored one are still inserted, but
+    flagged with possible_duplicate_of for review.
+    """
+    report = {'inserted': 0, 'matched': 0, 'skipped': 0, 'possible_duplicates': 0}
+    
+    async def write(batch: List[dict]):
+        await import_publication_batch(batch, report)
+        if on_batch:
+            await on_batch(report)
+    
+    if isinstance(publications, list):
+        for start in range(0, len(publications), RIS_IMPORT_BATCH_SIZE):
+            await write(publications[start:start + RIS_IMPORT_BATCH_SIZE])
+        return report
+    
+    batch = []
+    async for pub in publications:
+        batch.append(pub)
+        if len(batch) >= RIS_IMPORT_BATCH_SIZE:
+            await write(batch)
+            batch = []
+    if batch:
+        await write(batch)
+    return report
+
+async def import_publication_batch(publications: List[dict], report: dict):
+    """Upsert one batch of publications in a single bulk write, adding the outcome to report"""
+    batch = []
+    seen_keys = set()
+    seen_dois = set()
+    for pub in publications:
+        key = publication_dedup_key(pub)
+        doi_key = normalize_doi(pub.get('doi'))
+        if not normalize_title(pub.get('title', '')) or key in seen_keys or (doi_key and doi_key in seen_dois):
+            report['skipped'] += 1
+            continue
+        seen_keys.add(key)
+        if doi_key:
+            seen_dois.add(doi_key)
+        batch.append((pub, key, doi_key))
+    
+    # One query for the whole batch: DOIs that are already in the collection
+    dois = [doi_key for _, _, doi_key in batch if doi_key]
+    existing_dois = set()
+    if dois:
+        existing_dois = set(await db.static_publications.distinct('doi_key', {'doi_key': {'$in': dois}}))
+    
+    docs = []
+    for pub, key, doi_key in batch:
+        if doi_key in existing_dois:
+            report['matched'] += 1
+            continue
+        doc = {**pub, 'id': str(uuid.uuid4()), 'created_at': datetime.now(timezone.utc), 'dedup_key': key, **near_duplicate_fields(pub)}
+        if doi_key:
+            doc['doi_key'] = doi_key
+        docs.append(doc)
+    
+    if not docs:
+        return
+    
+    # Flag near-duplicates of stored publications (exact key matches are excluded by the upsert)
+    existing_keys = set(await db.static_publications.distinct('dedup_key', {'dedup_key': {'$in': [doc['dedup_key'] for doc in docs]}}))
+    for index, (publication_id, similarity) in (await find_near_duplicates(docs)).items():
+        if docs[index]['dedup_key'] not in existing_keys:
+            docs[index]['possible_duplicate_of'] = {'id': publication_id, 'similarity': round(similarity, 2)}
+            report['possible_duplicates'] += 1
+    
+    operations = [UpdateOne({'dedup_key': doc['dedup_key']}, {'$setOnInsert': doc}, upsert=True) for doc in docs]
+    try:
+        result = await db.static_publications.bulk_write(operations, ordered=False)
+        details = result.bulk_api_result
+    except BulkWriteError as e:
+        # A concurrent import inserted the same key between our upsert's match and insert
+        details = e.details
+        report['matched'] += sum(1 for error in details.get('writeErrors', []) if error.get('code') == 11000)
+    report['inserted'] += details.get('nUpserted', 0)
+    report['matched'] += details.get('nMatched', 0)
+
+async def backfill_publication_dedup_keys():
+    """Give publications created before dedup keys existed their dedup_key/doi_key (first copy wins)
+    and MinHash/LSH fields"""
+    taken = set(await db.static_publications.distinct('dedup_key'))
+    operations = []
+    missing = {'$or': [{'dedup_key': {'$exists': False}}, {'lsh_bands': {'$exists': False}}]}
+    async for pub in db.static_publications.find(missing).sort('created_at', 1):
+        fields = {}
+        key = publication_dedup_key(pub)
+        if 'dedup_key' not in pub and key not in taken:
+            taken.add(key)
+            fields['dedup_key'] = key
+        if normalize_doi(pub.get('doi')):
+            fields['doi_key'] = normalize_doi(pub.get('doi'))
+        if 'lsh_bands' not in pub:
+            fields.update(near_duplicate_fields(pub))
+        if fields:
+            operations.append(UpdateOne({'_id': pub['_id']}, {'$set': fields}))
+    if operations:
+        await db.static_publications.bulk_write(operations, ordered=False)
+        logging.info(f"Backfilled dedup keys for {len(operations)} publications")
+
+# Shared async HTTP client for outbound scraping/API requests
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=15, follow_redirects=True)
+    return _http_client
+
+# External source endpoints and timeouts; override the base URLs to replay against a local stub server
+SCHOLAR_BASE_URL = os.environ.get('SCHOLAR_BASE_URL', 'https://scholar.google.com').rstrip('/')
+SCOPUS_WEB_BASE_URL = os.environ.get('SCOPUS_WEB_BASE_URL', 'https://www.scopus.com').rstrip('/')
+ELSEVIER_API_BASE_URL = os.environ.get('ELSEVIER_API_BASE_URL', 'https://api.elsevier.com').rstrip('/')
+SCHOLAR_TIMEOUT_SECONDS = float(os.environ.get('SCHOLAR_TIMEOUT_SECONDS', '8'))
+SCOPUS_TIMEOUT_SECONDS = float(os.environ.get('SCOPUS_TIMEOUT_SECONDS', '15'))
+
+def latency_percentile(latencies_ms, pct: float) -> Optional[float]:
+    if not latencies_ms:
+        return None
+    values = sorted(latencies_ms)
+    return round(values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))], 1)
+
+class SourceHealth:
+    """Latency and outcome statistics for one external source (per worker process; every worker
+    stores its state in the source_health collection, see save_source_health_snapshot)"""
+    
+    def __init__(self, name: str, window: int = 200):
+        self.name = name
+        self.latencies_ms = deque(maxlen=window)
+        self.success_count = 0
+        self.error_count = 0
+        self.last_success: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.last_error_at: Optional[datetime] = None
+    
+    def record_success(self, latency_ms: float):
+        self.latencies_ms.append(latency_ms)
+        self.success_count += 1
+        self.last_success = datetime.now(timezone.utc)
+    
+    def record_failure(self, latency_ms: float, error: str):
+        self.latencies_ms.append(latency_ms)
+        self.error_count += 1
+        self.last_error = error
+        self.last_error_at = datetime.now(timezone.utc)
+    
+    def percentile(self, pct: float) -> Optional[float]:
+        return latency_percentile(self.latencies_ms, pct)
+    
+    def snapshot(self) -> dict:
+        return {
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'success_count': self.success_count,
+            'error_count': self.error_count,
+            'last_success': self.last_success,
+            'last_error': self.last_error,
+            'last_error_at': self.last_error_at
+        }
+    
+    def state(self) -> dict:
+        """Raw counters and latency window, for merging with other workers' state"""
+        return {**self.snapshot(), 'latencies_ms': list(self.latencies_ms)}
+
+def merge_source_health(states: List[dict]) -> dict:
+    """Combine one source's state from several workers: summed counts, pooled latency percentiles"""
+    latencies = [latency for state in states for latency in state.get('latencies_ms', [])]
+    last_error = max((state for state in states if state.get('last_error_at')), key=lambda state: state['last_error_at'], default={})
+    return {
+        'p50_ms': latency_percentile(latencies, 50),
+        'p95_ms': latency_percentile(latencies, 95),
+        'success_count': sum(state.get('success_count', 0) for state in states),
+        'error_count': sum(state.get('error_count', 0) for state in states),
+        'last_success': max((state['last_success'] for state in states if state.get('last_success')), default=None),
+        'last_error': last_error.get('last_error'),
+        'last_error_at': last_error.get('last_error_at')
+    }
+
+# Health of each outbound source, and where the data we last served came from
+source_health = {name: SourceHealth(name) for name in ('google_scholar', 'scopus_profile', 'scopus_search_api', 'scopus_author_api')}
+served_origins: Dict[str, dict] = {}
+
+def record_served(product: str, origin: str):
+    """Record whether a response used live data, the cache or fallback data"""
+    entry = served_origins.setdefault(product, {'counts': {'live': 0, 'cache': 0, 'fallback': 0}})
+    entry['counts'][origin] += 1
+    entry['last_origin'] = origin
+    entry['last_served'] = datetime.now(timezone.utc)
+
+async def source_get(source: str, url: str, **kwargs) -> httpx.Response:
+    """GET through the shared client, recording latency and outcome for the source"""
+    started = time.perf_counter()
+    try:
+        response = await get_http_client().get(url, **kwargs)
     except Exception as e:
-        raise HTTPException(status_code=400, detail=f"RIS file parsing failed: {str(e)}")
+        source_health[source].record_failure((time.perf_counter() - started) * 1000, f"{type(e).__name__}: {e}")
+        raise
+    
+    latency_ms = (time.perf_counter() - started) * 1000
+    if response.status_code >= 400:
+        source_health[source].record_failure(latency_ms, f"HTTP {response.status_code}")
+    else:
+        source_health[source].record_success(latency_ms)
+    return response
+
+# Outbound fetches currently in flight, keyed by source and arguments
+_inflight_fetches: Dict[str, asyncio.Future] = {}
+
+async def single_flight(key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Run fetch() once per key; concurrent callers for the same key share its result"""
+    task = _inflight_fetches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight_fetches[key] = task
+
+        def _forget(done: asyncio.Future):
+            if _inflight_fetches.get(key) is done:
+                del _inflight_fetches[key]
+        task.add_done_callback(_forget)
+    # Shield so a cancelled caller does not cancel the fetch shared with other callers
+    return await asyncio.shield(task)
+
+class CircuitBreaker:
+    """Stop calling a failing source for a cool-down window after consecutive failures"""
+    
+    def __init__(self, name: str, failure_threshold: int, cooldown_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.consecutive_failures = 0
+        self.opened_at: Optional[datetime] = None
+    
+    def is_open(self) -> bool:
+        """True while cooling down; after the window one trial call is let through"""
+        if self.opened_at is None:
+            return False
+        elapsed = (datetime.now(timezone.utc) - self.opened_at).total_seconds()
+        return elapsed < self.cooldown_seconds
+    
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.opened_at = None
+    
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= self.failure_threshold:
+            self.opened_at = datetime.now(timezone.utc)
+            logging.warning(f"{self.name} circuit open for {self.cooldown_seconds:.0f}s after {self.consecutive_failures} consecutive failures")
 
 # Hardcoded fallback values for Ahmad Zaharin Aris
 SCHOLAR_FALLBACK_DATA = {
@@ -364,20 +1377,100 @@ SCHOLAR_FALLBACK_DATA = {
     'i10_index': 48
 }
 
-# Cache for Google Scholar data
-_scholar_cache = {'data': None, 'last_fetched': None}
+# Google Scholar profile of the principal investigator
+SCHOLAR_PROFILE_ID = "7pUFcrsAAAAJ"
+
+# Cache for Google Scholar data: the scholar_cache collection, keyed by scholar ID, is
+# shared by all worker processes and survives restarts
 CACHE_DURATION_HOURS = 168  # 7 days
 
-def fetch_google_scholar_data(scholar_id: str) -> dict:
+# Retry/backoff and circuit breaker settings for Google Scholar scraping
+SCHOLAR_BACKOFF_BASE_SECONDS = float(os.environ.get('SCHOLAR_BACKOFF_BASE_SECONDS', '2'))
+scholar_breaker = CircuitBreaker(
+    'Google Scholar',
+    failure_threshold=int(os.environ.get('SCHOLAR_BREAKER_THRESHOLD', '5')),
+    cooldown_seconds=float(os.environ.get('SCHOLAR_BREAKER_COOLDOWN_MINUTES', '60')) * 60
+)
+
+# The scrapers only need a small part of each page, so parse just those subtrees with lxml
+SCHOLAR_METRICS_STRAINER = SoupStrainer('table', id='gsc_rsb_st')
+SCOPUS_DOCUMENTS_STRAINER = SoupStrainer(['tr', 'div'], class_=['searchArea', 'documentDataCol'])
+
+def parse_scholar_metrics(html: bytes) -> Optional[dict]:
+    """Extract citation metrics from a Google Scholar profile page (None if the table is missing)"""
+    soup = BeautifulSoup(html, 'lxml', parse_only=SCHOLAR_METRICS_STRAINER)
+    citation_table = soup.find('table', {'id': 'gsc_rsb_st'})
+    
+    if citation_table:
+        rows = citation_table.find_all('tr')
+        if len(rows) >= 3:
+            total_citations = rows[1].find_all('td')[1].text.strip().replace(',', '')
+            h_index = rows[2].find_all('td')[1].text.strip()
+            i10_index = rows[3].find_all('td')[1].text.strip() if len(rows) > 3 else "0"
+            
+            return {
+                'total_citations': int(total_citations) if total_citations.isdigit() else SCHOLAR_FALLBACK_DATA['total_citations'],
+                'h_index': int(h_index) if h_index.isdigit() else SCHOLAR_FALLBACK_DATA['h_index'],
+                'i10_index': int(i10_index) if i10_index.isdigit() else SCHOLAR_FALLBACK_DATA['i10_index'],
+                'last_updated': datetime.now(timezone.utc)
+            }
+    return None
+
+async def get_cached_scholar_data(scholar_id: str = SCHOLAR_PROFILE_ID) -> dict:
+    """Return cached citation metrics, or the hardcoded fallback if nothing was fetched yet"""
+    entry = await db.scholar_cache.find_one({'scholar_id': scholar_id})
+    if entry:
+        record_served('google_scholar', 'cache')
+        return entry['data']
+    record_served('google_scholar', 'fallback')
+    return {**SCHOLAR_FALLBACK_DATA, 'last_updated': datetime.now(timezone.utc)}
+
+async def fetch_google_scholar_data(scholar_id: str, force_refresh: bool = False) -> dict:
     """Fetch citation metrics from Google Scholar with caching and fallback"""
-    global _scholar_cache
+    entry = await db.scholar_cache.find_one({'scholar_id': scholar_id})
     
     # Check cache first
-    if _scholar_cache['data'] and _scholar_cache['last_fetched']:
-        time_diff = datetime.now(timezone.utc) - _scholar_cache['last_fetched']
+    if not force_refresh and entry:
+        time_diff = datetime.now(timezone.utc) - as_utc(entry['last_fetched'])
         if time_diff.total_seconds() < CACHE_DURATION_HOURS * 3600:
             print("Returning cached scholar data")
-            return _scholar_cache['data']
+            record_served('google_scholar', 'cache')
+            return entry['data']
+    
+    data = await scrape_google_scholar_metrics(scholar_id)
+    if data:
+        await store_scholar_metrics(scholar_id, data)
+        record_served('google_scholar', 'live')
+        return data
+    
+    # Return cached data if available
+    if entry:
+        print("Returning previously cached data")
+        record_served('google_scholar', 'cache')
+        return entry['data']
+    
+    # Return hardcoded fallback values (not cached, so the next refresh tries again)
+    print("Using hardcoded fallback data")
+    record_served('google_scholar', 'fallback')
+    return {**SCHOLAR_FALLBACK_DATA, 'last_updated': datetime.now(timezone.utc)}
+
+async def store_scholar_metrics(scholar_id: str, data: dict):
+    """Cache freshly scraped metrics in the shared scholar_cache collection"""
+    await db.scholar_cache.replace_one(
+        {'scholar_id': scholar_id},
+        {'scholar_id': scholar_id, 'data': data, 'last_fetched': datetime.now(timezone.utc)},
+        upsert=True
+    )
+
+async def scrape_google_scholar_metrics(scholar_id: str) -> Optional[dict]:
+    """Scrape live citation metrics from a Google Scholar profile (None on failure)"""
+    return await single_flight(f"scholar:{scholar_id}", lambda: _scrape_google_scholar_metrics(scholar_id))
+
+async def _scrape_google_scholar_metrics(scholar_id: str) -> Optional[dict]:
+    # Skip scraping entirely while the circuit is open
+    if scholar_breaker.is_open():
+        print("Google Scholar circuit open, skipping scrape")
+        return None
     
     # Try web scraping with multiple user agents
     user_agents = [
@@ -386,67 +1479,130 @@ def fetch_google_scholar_data(scholar_id: str) -> dict:
         'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     ]
     
-    for user_agent in user_agents:
+    for attempt, user_agent in enumerate(user_agents):
+        if scholar_breaker.is_open():
+            break
+        if attempt > 0:
+            # Exponential backoff with jitter between attempts, without blocking the event loop
+            delay = SCHOLAR_BACKOFF_BASE_SECONDS * (2 ** (attempt - 1))
+            await asyncio.sleep(delay + random.uniform(0, SCHOLAR_BACKOFF_BASE_SECONDS))
+        
         try:
-            import time
-            time.sleep(1)  # Small delay between attempts
-            
-            url = f"https://scholar.google.com/citations?user={scholar_id}&hl=en"
+            url = f"{SCHOLAR_BASE_URL}/citations?user={scholar_id}&hl=en"
             headers = {'User-Agent': user_agent}
             
-            response = requests.get(url, headers=headers, timeout=8)
+            response = await source_get('google_scholar', url, headers=headers, timeout=SCHOLAR_TIMEOUT_SECONDS)
             print(f"Google Scholar response: {response.status_code}")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                citation_table = soup.find('table', {'id': 'gsc_rsb_st'})
-                
-                if citation_table:
-                    rows = citation_table.find_all('tr')
-                    if len(rows) >= 3:
-                        total_citations = rows[1].find_all('td')[1].text.strip().replace(',', '')
-                        h_index = rows[2].find_all('td')[1].text.strip()
-                        i10_index = rows[3].find_all('td')[1].text.strip() if len(rows) > 3 else "0"
-                        
-                        data = {
-                            'total_citations': int(total_citations) if total_citations.isdigit() else SCHOLAR_FALLBACK_DATA['total_citations'],
-                            'h_index': int(h_index) if h_index.isdigit() else SCHOLAR_FALLBACK_DATA['h_index'],
-                            'i10_index': int(i10_index) if i10_index.isdigit() else SCHOLAR_FALLBACK_DATA['i10_index'],
-                            'last_updated': datetime.now(timezone.utc)
-                        }
-                        
-                        print(f"Successfully fetched live data: {data}")
-                        _scholar_cache['data'] = data
-                        _scholar_cache['last_fetched'] = datetime.now(timezone.utc)
-                        return data
+                data = parse_scholar_metrics(response.content)
+                if data:
+                    print(f"Successfully fetched live data: {data}")
+                    scholar_breaker.record_success()
+                    return data
             elif response.status_code == 429:
-                print("Rate limited, trying next user agent...")
-                continue
+                print("Rate limited, backing off before next user agent...")
         except Exception as e:
             print(f"Error with user agent {user_agent[:50]}: {e}")
-            continue
-    
-    # Return cached data if available
-    if _scholar_cache['data']:
-        print("Returning previously cached data")
-        return _scholar_cache['data']
+        
+        scholar_breaker.record_failure()
     
-    # Return hardcoded fallback values
-    print("Using hardcoded fallback data")
-    fallback_data = {
-        **SCHOLAR_FALLBACK_DATA,
-        'last_updated': datetime.now(timezone.utc)
-    }
-    _scholar_cache['data'] = fallback_data
-    _scholar_cache['last_fetched'] = datetime.now(timezone.utc)
-    return fallback_data
+    return None
 
-def fetch_scopus_publications_api(author_id: str, limit: int = 10) -> List[dict]:
-    """Fetch publications by scraping SCOPUS author profile page"""
+def parse_scopus_profile(html: bytes, limit: int = 10) -> List[dict]:
+    """Extract publications from a SCOPUS author profile page"""
+    soup = BeautifulSoup(html, 'lxml', parse_only=SCOPUS_DOCUMENTS_STRAINER)
+    publications = []
+    
+    # Find the documents section - publications are listed in table rows
+    # Look for publication entries in the document list
+    doc_rows = soup.find_all('tr', class_='searchArea')
     
+    if not doc_rows:
+        # Try alternative selector
+        doc_rows = soup.find_all('div', class_='documentDataCol')
+    
+    for idx, row in enumerate(doc_rows[:limit]):
+        try:
+            # Extract title
+            title_elem = row.find('a', class_='ddmDocTitle') or row.find('h4') or row.find('span', class_='docTitle')
+            title = title_elem.get_text(strip=True) if title_elem else 'Untitled'
+            
+            # Extract authors
+            authors_elem = row.find('span', class_='docAuthors') or row.find('span', class_='authorName')
+            authors = 'Unknown'
+            if authors_elem:
+                authors = authors_elem.get_text(strip=True)
+                # Clean up authors text
+                authors = authors.replace('Show all', '').replace('View in search results format', '').strip()
+            
+            # Extract journal/source
+            journal_elem = row.find('span', class_='sourceTitleText') or row.find('span', class_='publicationTitle')
+            journal = journal_elem.get_text(strip=True) if journal_elem else 'Unknown Journal'
+            
+            # Extract year and other metadata
+            year = 0
+            citations = 0
+            doi = ''
+            
+            # Look for year in various places
+            year_elem = row.find('span', class_='docYear') or row.find('span', text=re.compile(r'20\d{2}'))
+            if year_elem:
+                year_text = year_elem.get_text(strip=True)
+                year_match = re.search(r'(20\d{2})', year_text)
+                if year_match:
+                    year = int(year_match.group(1))
+            
+            # Extract citations
+            citations_elem = row.find('span', class_='docCitations') or row.find('a', string=re.compile(r'Cited by'))
+            if citations_elem:
+                citations_text = citations_elem.get_text(strip=True)
+                citations_match = re.search(r'(\d+)', citations_text)
+                if citations_match:
+                    citations = int(citations_match.group(1))
+            
+            # Extract the Scopus ID from the record link (eid=2-s2.0-<id>)
+            scopus_id = ''
+            if title_elem is not None and title_elem.get('href'):
+                eid_match = re.search(r'eid=2-s2\.0-(\d+)', title_elem['href'])
+                if eid_match:
+                    scopus_id = eid_match.group(1)
+            
+            # Extract DOI if available
+            doi_elem = row.find('a', href=re.compile(r'doi\.org'))
+            if doi_elem:
+                doi_href = doi_elem.get('href', '')
+                doi_match = re.search(r'doi\.org/(.+)$', doi_href)
+                if doi_match:
+                    doi = doi_match.group(1)
+            
+            pub = {
+                'title': title,
+                'authors': authors,
+                'journal': journal,
+                'year': year,
+                'doi': doi,
+                'citations': citations,
+                'scopus_id': scopus_id
+            }
+            pub['id'] = scopus_publication_id(pub)
+            
+            publications.append(pub)
+            
+        except Exception as e:
+            logging.warning(f"Error parsing publication {idx}: {e}")
+            continue
+    
+    return publications
+
+async def scrape_scopus_profile(author_id: str, limit: int = 10) -> List[dict]:
+    """Scrape publications from the SCOPUS author profile page (empty list on failure)"""
+    return await single_flight(f"scopus-scrape:{author_id}:{limit}", lambda: _scrape_scopus_profile(author_id, limit))
+
+async def _scrape_scopus_profile(author_id: str, limit: int) -> List[dict]:
     try:
         # Scrape publications from Scopus author profile page
-        url = f"https://www.scopus.com/authid/detail.uri?authorId={author_id}"
+        url = f"{SCOPUS_WEB_BASE_URL}/authid/detail.uri?authorId={author_id}"
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -454,145 +1610,112 @@ def fetch_scopus_publications_api(author_id: str, limit: int = 10) -> List[dict]
             'Connection': 'keep-alive',
         }
         
-        response = requests.get(url, headers=headers, timeout=15)
+        response = await source_get('scopus_profile', url, headers=headers, timeout=SCOPUS_TIMEOUT_SECONDS)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        publications = []
-        
-        # Find the documents section - publications are listed in table rows
-        # Look for publication entries in the document list
-        doc_rows = soup.find_all('tr', class_='searchArea')
-        
-        if not doc_rows:
-            # Try alternative selector
-            doc_rows = soup.find_all('div', class_='documentDataCol')
-        
-        for idx, row in enumerate(doc_rows[:limit]):
-            try:
-                # Extract title
-                title_elem = row.find('a', class_='ddmDocTitle') or row.find('h4') or row.find('span', class_='docTitle')
-                title = title_elem.get_text(strip=True) if title_elem else 'Untitled'
-                
-                # Extract authors
-                authors_elem = row.find('span', class_='docAuthors') or row.find('span', class_='authorName')
-                authors = 'Unknown'
-                if authors_elem:
-                    authors = authors_elem.get_text(strip=True)
-                    # Clean up authors text
-                    authors = authors.replace('Show all', '').replace('View in search results format', '').strip()
-                
-                # Extract journal/source
-                journal_elem = row.find('span', class_='sourceTitleText') or row.find('span', class_='publicationTitle')
-                journal = journal_elem.get_text(strip=True) if journal_elem else 'Unknown Journal'
-                
-                # Extract year and other metadata
-                year = 0
-                citations = 0
-                doi = ''
-                
-                # Look for year in various places
-                year_elem = row.find('span', class_='docYear') or row.find('span', text=re.compile(r'20\d{2}'))
-                if year_elem:
-                    year_text = year_elem.get_text(strip=True)
-                    year_match = re.search(r'(20\d{2})', year_text)
-                    if year_match:
-                        year = int(year_match.group(1))
-                
-                # Extract citations
-                citations_elem = row.find('span', class_='docCitations') or row.find('a', string=re.compile(r'Cited by'))
-                if citations_elem:
-                    citations_text = citations_elem.get_text(strip=True)
-                    citations_match = re.search(r'(\d+)', citations_text)
-                    if citations_match:
-                        citations = int(citations_match.group(1))
-                
-                # Extract DOI if available
-                doi_elem = row.find('a', href=re.compile(r'doi\.org'))
-                if doi_elem:
-                    doi_href = doi_elem.get('href', '')
-                    doi_match = re.search(r'doi\.org/(.+)$', doi_href)
-                    if doi_match:
-                        doi = doi_match.group(1)
-                
-                pub = {
-                    'id': str(uuid.uuid4()),
-                    'title': title,
-                    'authors': authors,
-                    'journal': journal,
-                    'year': year,
-                    'doi': doi,
-                    'citations': citations,
-                    'scopus_id': f'SCRAPED_{idx}'
-                }
-                
-                publications.append(pub)
-                
-            except Exception as e:
-                logging.warning(f"Error parsing publication {idx}: {e}")
-                continue
+        publications = parse_scopus_profile(response.content, limit)
         
         if publications:
             logging.info(f"Successfully scraped {len(publications)} publications from Scopus author profile")
-            return publications
         else:
-            logging.warning("No publications found by scraping, using API fallback")
-            return fetch_scopus_api_fallback(author_id, limit)
+            logging.warning("No publications found by scraping Scopus author profile")
+        return publications
         
     except Exception as e:
         logging.error(f"Error scraping Scopus profile: {e}")
-        return fetch_scopus_api_fallback(author_id, limit)
+        return []
 
-def fetch_scopus_api_fallback(author_id: str, limit: int = 10) -> List[dict]:
-    """Fallback to Scopus API when scraping fails"""
-    api_key = os.environ.get('SCOPUS_API_KEY')
+async def query_scopus_search_api(author_id: str, limit: int = 10) -> List[dict]:
+    """Query the Scopus Search API for an author's publications (empty list on failure)"""
+    return await single_flight(f"scopus-api:{author_id}:{limit}", lambda: _query_scopus_search_api(author_id, limit))
+
+SCOPUS_SEARCH_URL = f"{ELSEVIER_API_BASE_URL}/content/search/scopus"
+
+def scopus_entry_to_publication(entry: dict) -> dict:
+    """Convert a Scopus Search API entry to our publication dict"""
+    scopus_id = entry.get('dc:identifier', '').replace('SCOPUS_ID:', '')
     
-    if not api_key:
-        logging.warning("SCOPUS_API_KEY not found, using mock data")
-        return get_mock_scopus_publications(limit)
+    pub = {
+        'title': entry.get('dc:title', 'Untitled'),
+        'authors': entry.get('dc:creator', 'Unknown'),
+        'journal': entry.get('prism:publicationName', 'Unknown Journal'),
+        'year': 0,
+        'doi': entry.get('prism:doi', ''),
+        'citations': int(entry.get('citedby-count', 0)),
+        'scopus_id': scopus_id
+    }
     
+    cover_date = entry.get('prism:coverDate', '')
+    if cover_date:
+        try:
+            pub['year'] = int(cover_date.split('-')[0])
+        except (ValueError, IndexError):
+            pass
+    
+    pub['id'] = scopus_publication_id(pub)
+    return pub
+
+async def fetch_scopus_search_page(author_id: str, start: int, count: int) -> dict:
+    """Fetch one page of the Scopus Search API for an author (raises on HTTP errors)"""
+    headers = {
+        'X-ELS-APIKey': os.environ['SCOPUS_API_KEY'],
+        'Accept': 'application/json'
+    }
+    params = {
+        'query': f'AU-ID({author_id})',
+        'sort': 'pubyear desc',
+        'start': start,
+        'count': count
+    }
+    
+    response = await source_get('scopus_search_api', SCOPUS_SEARCH_URL, headers=headers, params=params, timeout=SCOPUS_TIMEOUT_SECONDS)
+    response.raise_for_status()
+    return response.json().get('search-results', {})
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date (None if absent or invalid)"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
     try:
-        # Try API approach
-        url = "https://api.elsevier.com/content/search/scopus"
-        headers = {
-            'X-ELS-APIKey': api_key,
-            'Accept': 'application/json'
-        }
-        params = {
-            'query': f'AU-ID({author_id})',
-            'sort': 'pubyear desc',
-            'count': limit
-        }
-        
-        response = requests.get(url, headers=headers, params=params, timeout=15)
-        response.raise_for_status()
-        
-        data = response.json()
-        publications = []
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+async def fetch_scopus_search_page_with_retry(author_id: str, start: int, count: int) -> dict:
+    """Fetch one Scopus Search API page, retrying 429s, 5xx responses and timeouts with backoff.
+    
+    Waits for the server's Retry-After when one is given; raises once the retries are used up.
+    """
+    for attempt in range(SCOPUS_PAGE_RETRIES + 1):
+        try:
+            return await fetch_scopus_search_page(author_id, start, count)
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if attempt == SCOPUS_PAGE_RETRIES or (status != 429 and status < 500):
+                raise
+            delay = retry_after_seconds(e.response)
+        except httpx.TransportError:
+            if attempt == SCOPUS_PAGE_RETRIES:
+                raise
+            delay = None
         
-        if 'search-results' in data and 'entry' in data['search-results']:
-            for entry in data['search-results']['entry']:
-                scopus_id = entry.get('dc:identifier', '').replace('SCOPUS_ID:', '')
-                
-                pub = {
-                    'id': str(uuid.uuid4()),
-                    'title': entry.get('dc:title', 'Untitled'),
-                    'authors': entry.get('dc:creator', 'Unknown'),
-                    'journal': entry.get('prism:publicationName', 'Unknown Journal'),
-                    'year': 0,
-                    'doi': entry.get('prism:doi', ''),
-                    'citations': int(entry.get('citedby-count', 0)),
-                    'scopus_id': scopus_id
-                }
-                
-                cover_date = entry.get('prism:coverDate', '')
-                if cover_date:
-                    try:
-                        pub['year'] = int(cover_date.split('-')[0])
-                    except (ValueError, IndexError):
-                        pass
-                
-                publications.append(pub)
+        if delay is None:
+            delay = SCOPUS_BACKOFF_BASE_SECONDS * (2 ** attempt) + random.uniform(0, SCOPUS_BACKOFF_BASE_SECONDS)
+        await asyncio.sleep(min(delay, SCOPUS_RETRY_AFTER_MAX_SECONDS))
+
+async def _query_scopus_search_api(author_id: str, limit: int) -> List[dict]:
+    if not os.environ.get('SCOPUS_API_KEY'):
+        logging.warning("SCOPUS_API_KEY not found, skipping Scopus API")
+        return []
+    
+    try:
+        results = await fetch_scopus_search_page(author_id, 0, limit)
+        publications = [scopus_entry_to_publication(entry) for entry in results.get('entry', []) if 'error' not in entry]
         
         if publications:
             # Sort by year descending (newest first)
@@ -601,8 +1724,95 @@ def fetch_scopus_api_fallback(author_id: str, limit: int = 10) -> List[dict]:
             return publications[:limit]  # Return only requested limit
         
     except Exception as e:
-        logging.error(f"API fallback also failed: {e}")
+        logging.error(f"Scopus API request failed: {e}")
+    
+    return []
+
+# Full-bibliography ingest settings (the Scopus Search API caps start+count at 5000)
+SCOPUS_PAGE_SIZE = int(os.environ.get('SCOPUS_PAGE_SIZE', '25'))
+SCOPUS_INGEST_CONCURRENCY = int(os.environ.get('SCOPUS_INGEST_CONCURRENCY', '4'))
+SCOPUS_INGEST_MAX_RESULTS = 5000
+SCOPUS_PAGE_RETRIES = int(os.environ.get('SCOPUS_PAGE_RETRIES', '3'))
+SCOPUS_BACKOFF_BASE_SECONDS = float(os.environ.get('SCOPUS_BACKOFF_BASE_SECONDS', '1'))
+SCOPUS_RETRY_AFTER_MAX_SECONDS = 60
+
+async def ingest_scopus_bibliography(author_id: str) -> Tuple[List[dict], bool]:
+    """Fetch an author's complete bibliography from the Scopus Search API.
     
+    Returns the publications (empty on failure) and whether every page was fetched.
+    """
+    return await single_flight(f"scopus-ingest:{author_id}", lambda: _ingest_scopus_bibliography(author_id))
+
+async def _ingest_scopus_bibliography(author_id: str) -> Tuple[List[dict], bool]:
+    if not os.environ.get('SCOPUS_API_KEY'):
+        logging.warning("SCOPUS_API_KEY not found, skipping Scopus bibliography ingest")
+        return [], False
+    
+    try:
+        # The first page tells us how many results there are in total
+        first_page = await fetch_scopus_search_page_with_retry(author_id, 0, SCOPUS_PAGE_SIZE)
+        total = min(int(first_page.get('opensearch:totalResults', 0)), SCOPUS_INGEST_MAX_RESULTS)
+    except Exception as e:
+        logging.error(f"Scopus bibliography ingest failed for author {author_id}: {e}")
+        return [], False
+    
+    semaphore = asyncio.Semaphore(SCOPUS_INGEST_CONCURRENCY)
+    
+    async def fetch_page(start: int) -> Optional[dict]:
+        async with semaphore:
+            try:
+                return await fetch_scopus_search_page_with_retry(author_id, start, min(SCOPUS_PAGE_SIZE, total - start))
+            except Exception as e:
+                logging.warning(f"Scopus page at {start} failed for author {author_id} after retries: {e}")
+                return None
+    
+    # Remaining pages are fetched concurrently; a page that still fails after its retries
+    # is dropped and the ingest is reported incomplete so stale records are not removed
+    pages = [first_page] + await asyncio.gather(*[
+        fetch_page(start) for start in range(SCOPUS_PAGE_SIZE, total, SCOPUS_PAGE_SIZE)
+    ])
+    fetched = [page for page in pages if page is not None]
+    complete = len(fetched) == len(pages)
+    
+    publications = {}
+    for page in fetched:
+        for entry in page.get('entry', []):
+            if 'error' in entry:
+                continue
+            pub = scopus_entry_to_publication(entry)
+            publications[scopus_publication_key(pub)] = pub
+    
+    result = sorted(publications.values(), key=lambda x: x.get('year', 0), reverse=True)
+    logging.info(f"Ingested {len(result)} of {total} Scopus publications for author {author_id} in {len(fetched)} of {len(pages)} pages")
+    return result, complete
+
+async def fetch_scopus_bibliography(author_id: str) -> Tuple[List[dict], bool]:
+    """Fetch the full bibliography from the Scopus API, else scrape the profile page.
+    
+    Returns the publications (empty if both fail) and whether they are the complete bibliography.
+    """
+    publications, complete = await ingest_scopus_bibliography(author_id)
+    if publications:
+        return publications, complete
+    return await scrape_scopus_profile(author_id, SCOPUS_CACHE_FETCH_LIMIT), False
+
+async def fetch_scopus_publications_api(author_id: str, limit: int = 10) -> List[dict]:
+    """Fetch publications by scraping SCOPUS author profile page"""
+    publications = await scrape_scopus_profile(author_id, limit)
+    if publications:
+        record_served('scopus', 'live')
+        return publications
+    logging.warning("No publications found by scraping, using API fallback")
+    return await fetch_scopus_api_fallback(author_id, limit)
+
+async def fetch_scopus_api_fallback(author_id: str, limit: int = 10) -> List[dict]:
+    """Fallback to Scopus API when scraping fails"""
+    publications = await query_scopus_search_api(author_id, limit)
+    if publications:
+        record_served('scopus', 'live')
+        return publications
+    logging.warning("Scopus API returned no publications, using mock data")
+    record_served('scopus', 'fallback')
     return get_mock_scopus_publications(limit)
 
 def get_mock_scopus_publications(limit: int = 10) -> List[dict]:
@@ -713,6 +1923,297 @@ def get_mock_scopus_publications(limit: int = 10) -> List[dict]:
     sorted_publications = sorted(mock_publications, key=lambda x: x['year'], reverse=True)
     return sorted_publications[:limit]
 
+# Persistent cache for SCOPUS publications. Records live in scopus_publications, keyed by
+# author ID plus a stable publication key; scopus_cache keeps per-author fetch metadata.
+# The fetch limit only applies when falling back to scraping the profile page.
+SCOPUS_CACHE_FETCH_LIMIT = int(os.environ.get('SCOPUS_CACHE_FETCH_LIMIT', '50'))
+SCOPUS_SYNC_FIELDS = ['title', 'authors', 'journal', 'year', 'doi', 'citations', 'scopus_id']
+
+def as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes read back from MongoDB as UTC"""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+def scopus_publication_key(pub: dict) -> str:
+    """Stable key for a SCOPUS record: its Scopus ID, else its DOI, else title and year"""
+    if pub.get('scopus_id'):
+        return f"scopus:{pub['scopus_id']}"
+    if pub.get('doi'):
+        return f"doi:{pub['doi'].strip().lower()}"
+    return f"title:{' '.join(pub.get('title', '').lower().split())}|{pub.get('year', 0)}"
+
+def scopus_publication_id(pub: dict) -> str:
+    """Deterministic publication ID derived from the stable key"""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, scopus_publication_key(pub)))
+
+async def sync_scopus_publications(author_id: str, publications: List[dict], complete: bool) -> dict:
+    """Upsert only new or changed publications in one bulk write and report the delta.
+    
+    Records missing from the fetch are removed only when it covered the complete bibliography.
+    """
+    existing = {
+        doc['key']: doc
+        async for doc in db.scopus_publications.find({'author_id': author_id}, {'_id': 0, 'key': 1, **{f: 1 for f in SCOPUS_SYNC_FIELDS}})
+    }
+    now = datetime.now(timezone.utc)
+    operations = []
+    report = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'removed': 0}
+    seen = set()
+    
+    for pub in publications:
+        key = scopus_publication_key(pub)
+        if key in seen:
+            continue
+        seen.add(key)
+        
+        fields = {f: pub.get(f) for f in SCOPUS_SYNC_FIELDS}
+        current = existing.get(key)
+        if current is not None and all(current.get(f) == fields[f] for f in SCOPUS_SYNC_FIELDS):
+            report['unchanged'] += 1
+            continue
+        
+        report['updated' if current is not None else 'inserted'] += 1
+        operations.append(UpdateOne(
+            {'author_id': author_id, 'key': key},
+            {
+                '$set': {**fields, 'updated_at': now},
+                '$setOnInsert': {'id': scopus_publication_id(pub), 'created_at': now}
+            },
+            upsert=True
+        ))
+    
+    if complete:
+        stale_keys = [key for key in existing if key not in seen]
+        if stale_keys:
+            operations.append(DeleteMany({'author_id': author_id, 'key': {'$in': stale_keys}}))
+            report['removed'] = len(stale_keys)
+    
+    if operations:
+        await db.scopus_publications.bulk_write(operations, ordered=False)
+    return report
+
+async def refresh_scopus_cache(author_id: str) -> Optional[dict]:
+    """Fetch live SCOPUS publications and sync them into the scopus_publications collection"""
+    try:
+        publications, complete = await fetch_scopus_bibliography(author_id)
+        if not publications:
+            logging.warning(f"No live Scopus data for author {author_id}, keeping existing cache")
+            return None
+        
+        report = await sync_scopus_publications(author_id, publications, complete)
+        entry = {
+            'author_id': author_id,
+            'fetched_at': datetime.now(timezone.utc),
+            'count': len(publications),
+            'complete': complete,
+            'last_sync': report
+        }
+        await db.scopus_cache.replace_one({'author_id': author_id}, entry, upsert=True)
+        logging.info(f"Synced {len(publications)} Scopus publications for author {author_id}: {report}")
+        return entry
+    except Exception as e:
+        logging.error(f"Error refreshing Scopus cache for author {author_id}: {e}")
+        return None
+
+async def get_cached_scopus_publications(author_id: str, limit: int = 10, offset: int = 0, year: Optional[int] = None) -> List[dict]:
+    """Serve SCOPUS publications from the cache (refreshed by the background scheduler)"""
+    query = {'author_id': author_id}
+    if year is not None:
+        query['year'] = year
+    publications = await db.scopus_publications.find(query, {'_id': 0}).sort([('year', -1), ('key', 1)]).skip(offset).limit(limit).to_list(limit)
+    
+    if not publications and not await db.scopus_cache.find_one({'author_id': author_id}):
+        # Cold cache: serve fallback data until the scheduler fills the cache
+        record_served('scopus', 'fallback')
+        mock_publications = get_mock_scopus_publications(SCOPUS_CACHE_FETCH_LIMIT)
+        if year is not None:
+            mock_publications = [pub for pub in mock_publications if pub['year'] == year]
+        return mock_publications[offset:offset + limit]
+    
+    record_served('scopus', 'cache')
+    return publications
+
+# Citation metrics for team members (team_metrics collection, one document per member)
+TEAM_METRICS_CONCURRENCY = int(os.environ.get('TEAM_METRICS_CONCURRENCY', '3'))
+TEAM_METRICS_TTL_HOURS = float(os.environ.get('TEAM_METRICS_TTL_HOURS', '24'))
+SCOPUS_AUTHOR_URL = ELSEVIER_API_BASE_URL + "/content/author/author_id/{author_id}"
+ACTIVE_MEMBERS_WITH_PROFILES = {
+    'status': {'$ne': 'alumni'},
+    '$or': [{'scopus_id': {'$nin': [None, '']}}, {'google_scholar': {'$nin': [None, '']}}]
+}
+
+def extract_scholar_id(google_scholar: Optional[str]) -> Optional[str]:
+    """Get the scholar ID from a Google Scholar profile URL (or a bare ID)"""
+    if not google_scholar:
+        return None
+    match = re.search(r'[?&]user=([\w-]+)', google_scholar)
+    if match:
+        return match.group(1)
+    return google_scholar.strip() if re.fullmatch(r'[\w-]{12}', google_scholar.strip()) else None
+
+async def fetch_scopus_author_metrics(author_id: str) -> Optional[dict]:
+    """Fetch citation count and h-index from the Scopus Author Retrieval API (None on failure)"""
+    return await single_flight(f"scopus-author:{author_id}", lambda: _fetch_scopus_author_metrics(author_id))
+
+async def _fetch_scopus_author_metrics(author_id: str) -> Optional[dict]:
+    api_key = os.environ.get('SCOPUS_API_KEY')
+    if not api_key:
+        return None
+    
+    try:
+        headers = {
+            'X-ELS-APIKey': api_key,
+            'Accept': 'application/json'
+        }
+        response = await source_get('scopus_author_api', SCOPUS_AUTHOR_URL.format(author_id=author_id), headers=headers, params={'view': 'METRICS'}, timeout=SCOPUS_TIMEOUT_SECONDS)
+        response.raise_for_status()
+        
+        author = response.json()['author-retrieval-response'][0]
+        coredata = author.get('coredata', {})
+        return {
+            'total_citations': int(coredata.get('citation-count', 0)),
+            'h_index': int(author.get('h-index', 0)),
+            'i10_index': None,  # Scopus does not report an i10-index
+            'last_updated': datetime.now(timezone.utc)
+        }
+    except Exception as e:
+        logging.error(f"Error fetching Scopus metrics for author {author_id}: {e}")
+        return None
+
+async def fetch_member_metrics(member: dict) -> Optional[dict]:
+    """Fetch a member's metrics from Google Scholar, falling back to Scopus"""
+    scholar_id = extract_scholar_id(member.get('google_scholar'))
+    if scholar_id:
+        # Reuse metrics scraped recently, e.g. by the principal investigator refresh
+        entry = await db.scholar_cache.find_one({'scholar_id': scholar_id})
+        if entry and (datetime.now(timezone.utc) - as_utc(entry['last_fetched'])).total_seconds() < TEAM_METRICS_TTL_HOURS * 3600:
+            return {**entry['data'], 'source': 'google_scholar'}
+        data = await scrape_google_scholar_metrics(scholar_id)
+        if data:
+            await store_scholar_metrics(scholar_id, data)
+            return {**data, 'source': 'google_scholar'}
+    
+    if member.get('scopus_id'):
+        data = await fetch_scopus_author_metrics(member['scopus_id'])
+        if data:
+            return {**data, 'source': 'scopus'}
+    
+    return None
+
+async def refresh_team_metrics() -> dict:
+    """Refresh metrics for all active members concurrently, with bounded fan-out"""
+    members = await db.team_members.find(ACTIVE_MEMBERS_WITH_PROFILES).to_list(1000)
+    semaphore = asyncio.Semaphore(TEAM_METRICS_CONCURRENCY)
+    
+    async def refresh_member(member: dict) -> bool:
+        async with semaphore:
+            metrics = await fetch_member_metrics(member)
+        if not metrics:
+            return False
+        await db.team_metrics.replace_one(
+            {'member_id': member['id']},
+            {'member_id': member['id'], 'name': member['name'], **metrics},
+            upsert=True
+        )
+        return True
+    
+    results = await asyncio.gather(*[refresh_member(member) for member in members])
+    return {'members': len(members), 'updated': sum(results)}
+
+# Background refresh scheduler for external citation/publication sources. Every worker runs
+# the loop, but a lease in the scheduler_locks collection lets only one of them refresh per interval.
+SOURCE_REFRESH_INTERVAL_MINUTES = float(os.environ.get('SOURCE_REFRESH_INTERVAL_MINUTES', '360'))
+SOURCE_REFRESH_JITTER_SECONDS = float(os.environ.get('SOURCE_REFRESH_JITTER_SECONDS', '300'))
+REFRESH_LEASE_ID = 'source_refresh'
+# Every worker stores its source health state this often; snapshots of workers that stopped
+# expire from the source_health collection after SOURCE_HEALTH_SNAPSHOT_TTL_HOURS
+SOURCE_HEALTH_SNAPSHOT_SECONDS = float(os.environ.get('SOURCE_HEALTH_SNAPSHOT_SECONDS', '30'))
+SOURCE_HEALTH_SNAPSHOT_TTL_HOURS = 24
+WORKER_ID = str(uuid.uuid4())
+_refresh_state = {'next_run': None}
+_refresh_task: Optional[asyncio.Task] = None
+_health_snapshot_task: Optional[asyncio.Task] = None
+
+async def acquire_refresh_lease() -> bool:
+    """Take the shared refresh lease for one interval unless another worker holds it"""
+    now = datetime.now(timezone.utc)
+    try:
+        await db.scheduler_locks.update_one(
+            {'_id': REFRESH_LEASE_ID, 'expires_at': {'$lt': now}},
+            {'$set': {'owner': WORKER_ID, 'expires_at': now + timedelta(minutes=SOURCE_REFRESH_INTERVAL_MINUTES)}},
+            upsert=True
+        )
+        return True
+    except DuplicateKeyError:
+        # The lease document exists and has not expired yet
+        return False
+
+async def refresh_external_sources() -> dict:
+    """Refresh Google Scholar metrics, the SCOPUS publication cache and team member metrics"""
+    started_at = datetime.now(timezone.utc)
+    sources = {}
+    
+    try:
+        await fetch_google_scholar_data(SCHOLAR_PROFILE_ID, force_refresh=True)
+        sources['google_scholar'] = 'ok'
+    except Exception as e:
+        logging.error(f"Scheduled Google Scholar refresh failed: {e}")
+        sources['google_scholar'] = f"error: {e}"
+    
+    settings = await db.site_settings.find_one({}) or {}
+    scopus_id = settings.get('scopus_author_id', '22133247800')
+    entry = await refresh_scopus_cache(scopus_id)
+    sources['scopus'] = 'ok' if entry else 'no live data'
+    
+    try:
+        result = await refresh_team_metrics()
+        sources['team_metrics'] = f"updated {result['updated']} of {result['members']} members"
+    except Exception as e:
+        logging.error(f"Scheduled team metrics refresh failed: {e}")
+        sources['team_metrics'] = f"error: {e}"
+    
+    await db.scheduler_locks.update_one(
+        {'_id': REFRESH_LEASE_ID},
+        {'$set': {'last_run': started_at, 'last_run_by': WORKER_ID, 'sources': sources}}
+    )
+    return sources
+
+async def save_source_health_snapshot():
+    """Store this worker's source health where /admin/source-health can read it from any worker"""
+    await db.source_health.update_one(
+        {'_id': WORKER_ID},
+        {'$set': {
+            'snapshot_at': datetime.now(timezone.utc),
+            'sources': {name: health.state() for name, health in source_health.items()},
+            'scholar_circuit_open': scholar_breaker.is_open(),
+            'served': served_origins
+        }},
+        upsert=True
+    )
+
+async def run_source_health_snapshots():
+    """Store this worker's source health every SOURCE_HEALTH_SNAPSHOT_SECONDS, forever"""
+    while True:
+        try:
+            await save_source_health_snapshot()
+        except Exception as e:
+            logging.error(f"Saving source health snapshot failed: {e}")
+        await asyncio.sleep(SOURCE_HEALTH_SNAPSHOT_SECONDS)
+
+async def run_refresh_scheduler():
+    """Refresh external sources now and then on a jittered interval, forever"""
+    while True:
+        try:
+            if await acquire_refresh_lease():
+                await refresh_external_sources()
+            else:
+                logging.info("Source refresh lease held by another worker, skipping this run")
+        except Exception as e:
+            logging.error(f"Scheduled source refresh failed: {e}")
+        
+        delay = SOURCE_REFRESH_INTERVAL_MINUTES * 60 + random.uniform(0, SOURCE_REFRESH_JITTER_SECONDS)
+        _refresh_state['next_run'] = datetime.now(timezone.utc) + timedelta(seconds=delay)
+        await asyncio.sleep(delay)
+
 # Initialize default data
 async def initialize_default_data():
     """Initialize database with default research group data"""
@@ -946,7 +2447,7 @@ async def freeze_user(user_id: str, freeze: bool, current_user: User = Depends(g
 # Research Areas endpoints
 @api_router.get("/research-areas", response_model=List[ResearchArea])
 async def get_research_areas():
-    areas = await db.research_areas.find({}).to_list(100)
+    areas = await attach_srcsets(await db.research_areas.find({}).to_list(100), 'image_url', 'image_srcset')
     result = []
     for area in areas:
         area.pop('_id', None)
@@ -955,12 +2456,12 @@ async def get_research_areas():
 
 @api_router.post("/admin/research-areas", response_model=ResearchArea)
 async def create_research_area(area: ResearchArea, current_user: User = Depends(get_admin_user)):
-    await db.research_areas.insert_one(area.dict())
+    await db.research_areas.insert_one(area.dict(exclude={'image_srcset'}))
     return area
 
 @api_router.put("/admin/research-areas/{area_id}", response_model=ResearchArea)
 async def update_research_area(area_id: str, area: ResearchArea, current_user: User = Depends(get_admin_user)):
-    result = await db.research_areas.replace_one({'id': area_id}, area.dict())
+    result = await db.research_areas.replace_one({'id': area_id}, area.dict(exclude={'image_srcset'}))
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Research area not found")
     return area
@@ -972,26 +2473,457 @@ async def delete_research_area(area_id: str, current_user: User = Depends(get_ad
         raise HTTPException(status_code=404, detail="Research area not found")
     return {"message": "Research area deleted successfully"}
 
+def image_srcset(asset: dict) -> Dict[str, str]:
+    """srcset strings per format for an image asset's variants"""
+    return {
+        fmt: ', '.join(f"{upload_url(v['filename'])} {v['width']}w" for v in asset['variants'] if v['format'] == fmt)
+        for fmt in IMAGE_VARIANT_FORMATS
+    }
+
+async def attach_srcsets(docs: List[dict], url_field: str, srcset_field: str) -> List[dict]:
+    """Set srcset_field on documents whose url_field points at an upload, with one image_assets query"""
+    file_ids = {}
+    for doc in docs:
+        match = UPLOAD_REFERENCE_PATTERN.search(doc.get(url_field) or '')
+        doc[srcset_field] = None
+        if match:
+            file_ids[id(doc)] = match.group(1)
+    if file_ids:
+        assets = await db.image_assets.find(
+            {'file_id': {'$in': list(set(file_ids.values()))}}, {'_id': 0, 'file_id': 1, 'variants': 1}
+        ).to_list(None)
+        srcsets = {asset['file_id']: image_srcset(asset) for asset in assets}
+        for doc in docs:
+            doc[srcset_field] = srcsets.get(file_ids.get(id(doc)))
+    return docs
+
+def image_asset_response(asset: dict) -> dict:
+    """Upload response: main image URL plus srcset strings per format"""
+    srcset = image_srcset(asset)
+    
+    return {
+        "url": upload_url(asset['filename']),
+        "file_id": asset['file_id'],
+        "width": asset['width'],
+        "height": asset['height'],
+        "srcset": srcset,
+        "variants": [
+            {"url": upload_url(v['filename']), "width": v['width'], "height": v['height'], "format": v['format']}
+            for v in asset['variants']
+        ]
+    }
+
+def write_upload_file(filename: str, data: bytes):
+    """Write a file to the uploads directory unless it is already there (names are content hashes)"""
+    file_path = uploads_dir / filename
+    if file_path.is_file():
+        # Re-uploaded: restart the garbage collector's grace period
+        os.utime(file_path)
+    else:
+        # Write then rename, so a crash never leaves a truncated file under the final name
+        tmp_path = uploads_dir / f".{filename}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+
+# Image uploads are copied to a temp file in chunks (hashing as they go) and capped in size
+MAX_UPLOAD_BYTES = int(os.environ.get('MAX_UPLOAD_BYTES', str(20 * 1024 * 1024)))
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+IMAGE_UPLOAD_PATHS = ('/api/upload/image', '/api/upload/featured-image')
+# Slack for the multipart framing around the file itself when limiting whole request bodies
+UPLOAD_MULTIPART_SLACK_BYTES = 64 * 1024
+
+def upload_too_large(max_bytes: int = MAX_UPLOAD_BYTES) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"File too large (max {max_bytes // (1024 * 1024)} MB)")
+
+async def hash_upload(file: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> str:
+    """SHA-256 of an upload, read in chunks straight from the file Starlette already spooled.
+    
+    Raises 413 past max_bytes and leaves the file rewound for the caller.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    await file.seek(0)
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_bytes:
+            raise upload_too_large(max_bytes)
+        digest.update(chunk)
+    await file.seek(0)
+    return digest.hexdigest()
+
+async def spool_upload(file: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> Tuple[str, str]:
+    """Copy an upload to a temp file chunk by chunk; returns (path, sha256 hex). Caller removes the file.
+    
+    For readers outside the request: background jobs that run after Starlette's copy is gone,
+    and image workers, which need a path they can open.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    fd, path = tempfile.mkstemp(prefix='upload-')
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_BYTES)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise upload_too_large(max_bytes)
+                digest.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path, digest.hexdigest()
+
+async def store_uploaded_image(source: Union[bytes, str, UploadFile], source_hash: str, max_width: int = 800, max_height: int = 600) -> dict:
+    """Store an image (bytes, file path or upload) and its variants in image_assets, content-addressed.
+    
+    Identical images share one set of files and one document; whether an asset is still in use
+    is decided by the garbage collector's reference scan, not by a counter. A source already seen
+    (same SHA-256, same bounds) skips the resize/encode work, and an upload is never even read.
+    """
+    source_key = f"{source_hash}:{max_width}x{max_height}"
+    asset = await db.image_assets.find_one({'source_keys': source_key})
+    if asset and (uploads_dir / asset['filename']).is_file():
+        # Re-uploaded: restart the garbage collector's grace period
+        os.utime(uploads_dir / asset['filename'])
+        return asset
+    
+    if not isinstance(source, (bytes, str)):
+        # The worker process can't open Starlette's spooled file (unnamed once rolled over), so
+        # stream it to a temp file the worker can read by path; never load it into memory here
+        await source.seek(0)
+        path, _ = await spool_upload(source)
+        try:
+            return await store_uploaded_image(path, source_hash, max_width, max_height)
+        finally:
+            os.remove(path)
+    rendered = await upload_image_queue.run(render_image_variants, source, max_width, max_height)
+    
+    # Name the files after the processed bytes, so different sources that render identically dedupe too
+    file_id = hashlib.sha256(rendered['main']).hexdigest()[:32]
+    filename = f"{file_id}.jpg"
+    write_upload_file(filename, rendered['main'])
+    
+    variants = []
+    for variant in rendered['variants']:
+        variant_filename = f"{file_id}_{variant['width']}.{IMAGE_VARIANT_FORMATS[variant['format']]}"
+        write_upload_file(variant_filename, variant['data'])
+        variants.append({
+            'width': variant['width'],
+            'height': variant['height'],
+            'format': variant['format'],
+            'filename': variant_filename,
+            'bytes': len(variant['data'])
+        })
+    
+    await db.image_assets.update_one(
+        {'file_id': file_id},
+        {
+            '$setOnInsert': {
+                'filename': filename,
+                'width': rendered['width'],
+                'height': rendered['height'],
+                'bytes': len(rendered['main']),
+                'variants': variants,
+                'created_at': datetime.now(timezone.utc)
+            },
+            '$addToSet': {'source_keys': source_key}
+        },
+        upsert=True
+    )
+    return await db.image_assets.find_one({'file_id': file_id})
+
+# Content fields that hold image URLs (older documents may still carry inline data: URLs)
+IMAGE_URL_FIELDS = {
+    'site_settings': ['logo_url', 'menu_logo_url', 'supervisor_profile.photo_url'],
+    'team_members': ['photo_url'],
+    'research_highlights': ['image_url'],
+    'research_areas': ['image_url'],
+    'books': ['cover_image_url'],
+    'featured_publications': ['graphical_abstract'],
+    'news': ['image_url'],
+    'page_content': ['header_image_url']
+}
+INLINE_IMAGE_PATTERN = re.compile(r'^data:image/[\w.+-]+;base64,')
+
+def get_field(doc: dict, path: str) -> Any:
+    """Value at a dotted field path such as 'supervisor_profile.photo_url' (None if missing)"""
+    for key in path.split('.'):
+        if not isinstance(doc, dict):
+            return None
+        doc = doc.get(key)
+    return doc
+
+def decode_inline_image(value: str) -> bytes:
+    """Decode a data:image/...;base64 URL (raises ValueError if malformed)"""
+    return base64.b64decode(value[INLINE_IMAGE_PATTERN.match(value).end():], validate=True)
+
+# How often the migration waits out a busy image queue (503) before leaving an image for the next run
+INLINE_MIGRATION_BUSY_RETRIES = int(os.environ.get('INLINE_MIGRATION_BUSY_RETRIES', '3'))
+
+async def store_inline_image(content: bytes) -> dict:
+    """Store a decoded inline image, waiting for Retry-After while the upload queue is busy"""
+    for attempt in range(INLINE_MIGRATION_BUSY_RETRIES + 1):
+        try:
+            return await store_uploaded_image(content, hashlib.sha256(content).hexdigest())
+        except HTTPException as e:
+            if e.status_code != 503 or attempt == INLINE_MIGRATION_BUSY_RETRIES:
+                raise
+            await asyncio.sleep(float((e.headers or {}).get('Retry-After', IMAGE_RETRY_AFTER_SECONDS)))
+
+async def migrate_inline_images(batch_size: int = 50) -> dict:
+    """Move inline base64 images from content documents into the uploads store.
+    
+    Fields may be dotted paths into nested documents. Each batch of documents is rewritten with
+    one bulk write, and only where the field still holds the same data URL. Migrated fields no
+    longer match the scan, so an interrupted run can simply be started again; images skipped
+    because the image queue stayed busy are picked up by the next run.
+    """
+    report = {'documents': 0, 'images': 0, 'failed': 0, 'skipped': 0, 'bytes_before': 0, 'bytes_after': 0, 'collections': {}}
+    
+    for collection_name, fields in IMAGE_URL_FIELDS.items():
+        collection = db[collection_name]
+        query = {'$or': [{field: {'$regex': '^data:image/'}} for field in fields]}
+        counts = {'documents': 0, 'images': 0, 'failed': 0, 'skipped': 0}
+        last_id = None
+        
+        while True:
+            # Page by _id so documents that failed or were skipped are not scanned again this run
+            page_query = query if last_id is None else {'$and': [query, {'_id': {'$gt': last_id}}]}
+            projection = {field: 1 for field in fields}
+            docs = await collection.find(page_query, projection).sort('_id', 1).limit(batch_size).to_list(batch_size)
+            if not docs:
+                break
+            last_id = docs[-1]['_id']
+            
+            operations = []
+            for doc in docs:
+                changes = {}
+                for field in fields:
+                    value = get_field(doc, field)
+                    if not isinstance(value, str) or not INLINE_IMAGE_PATTERN.match(value):
+                        continue
+                    try:
+                        asset = await store_inline_image(decode_inline_image(value))
+                    except HTTPException as e:
+                        if e.status_code == 503:
+                            logging.warning(f"Image queue busy, leaving inline image in {collection_name}.{field} ({doc['_id']}) for the next run")
+                            counts['skipped'] += 1
+                            continue
+                        logging.warning(f"Could not migrate inline image in {collection_name}.{field} ({doc['_id']}): {e.detail}")
+                        counts['failed'] += 1
+                        continue
+                    except ValueError as e:
+                        logging.warning(f"Could not migrate inline image in {collection_name}.{field} ({doc['_id']}): {e}")
+                        counts['failed'] += 1
+                        continue
+                    url = upload_url(asset['filename'])
+                    changes[field] = (value, url)
+                    report['bytes_before'] += len(value)
+                    report['bytes_after'] += len(url)
+                
+                if changes:
+                    counts['documents'] += 1
+                    counts['images'] += len(changes)
+                    operations.append(UpdateOne(
+                        {'_id': doc['_id'], **{field: old for field, (old, _) in changes.items()}},
+                        {'$set': {field: new for field, (_, new) in changes.items()}}
+                    ))
+            
+            if operations:
+                await collection.bulk_write(operations, ordered=False)
+        
+        report['collections'][collection_name] = counts
+        for key in ('documents', 'images', 'failed', 'skipped'):
+            report[key] += counts[key]
+    
+    report['bytes_reclaimed'] = report['bytes_before'] - report['bytes_after']
+    logging.info(f"Migrated {report['images']} inline images in {report['documents']} documents, reclaimed {report['bytes_reclaimed']} bytes")
+    return report
+
+# Orphaned-upload garbage collection: uploads not referenced by any content document are
+# deleted once all their files are older than the grace period (fresh uploads may not be saved yet)
+UPLOAD_GC_GRACE_HOURS = float(os.environ.get('UPLOAD_GC_GRACE_HOURS', '24'))
+UPLOAD_GC_BATCH_SIZE = int(os.environ.get('UPLOAD_GC_BATCH_SIZE', '100'))
+# Collections that never hold content references to uploads; every other collection is scanned
+UPLOAD_GC_SKIP_COLLECTIONS = {'image_assets', 'users', 'scheduler_locks', 'source_health', 'scopus_cache', 'scopus_publications', 'scholar_cache', 'team_metrics'}
+UPLOAD_REFERENCE_PATTERN = re.compile(r'/api/uploads/([\w-]+?)(?:_\d+)?\.(?:jpg|webp)')
+UPLOAD_FILE_PATTERN = re.compile(r'^([\w-]+?)(?:_\d+)?\.(?:jpg|webp)$')
+
+async def referenced_upload_ids() -> set:
+    """File IDs referenced anywhere in content documents (including nested fields and HTML)"""
+    referenced = set()
+    for collection_name in await db.list_collection_names():
+        if collection_name in UPLOAD_GC_SKIP_COLLECTIONS or collection_name.startswith('system.'):
+            continue
+        async for doc in db[collection_name].find({}):
+            referenced.update(UPLOAD_REFERENCE_PATTERN.findall(json.dumps(doc, default=str)))
+    return referenced
+
+async def collect_orphaned_uploads(grace_hours: float = UPLOAD_GC_GRACE_HOURS, dry_run: bool = True) -> dict:
+    """Delete (or with dry_run just report) unreferenced uploads older than the grace period"""
+    cutoff = time.time() - grace_hours * 3600
+    
+    # Group the main file and its variants by file ID; a group is as old as its newest file
+    groups: Dict[str, List[Path]] = {}
+    stale_temp_files = []
+    for path in uploads_dir.iterdir():
+        if not path.is_file():
+            continue
+        match = UPLOAD_FILE_PATTERN.match(path.name)
+        if match:
+            groups.setdefault(match.group(1), []).append(path)
+        elif path.name.startswith('.') and path.name.endswith('.tmp') and path.stat().st_mtime < cutoff:
+            stale_temp_files.append(path)
+    
+    referenced = await referenced_upload_ids()
+    orphaned = [
+        file_id for file_id, paths in groups.items()
+        if file_id not in referenced and max(p.stat().st_mtime for p in paths) < cutoff
+    ]
+    
+    report = {
+        'dry_run': dry_run,
+        'scanned_uploads': len(groups),
+        'referenced_uploads': len(referenced & groups.keys()),
+        'orphaned_uploads': len(orphaned),
+        'deleted_files': 0,
+        'bytes_reclaimed': 0,
+        'orphaned_sample': orphaned[:50]
+    }
+    
+    for path in stale_temp_files:
+        report['bytes_reclaimed'] += path.stat().st_size
+        if not dry_run:
+            path.unlink(missing_ok=True)
+            report['deleted_files'] += 1
+    
+    for start in range(0, len(orphaned), UPLOAD_GC_BATCH_SIZE):
+        batch = orphaned[start:start + UPLOAD_GC_BATCH_SIZE]
+        for file_id in batch:
+            for path in groups[file_id]:
+                report['bytes_reclaimed'] += path.stat().st_size
+                if not dry_run:
+                    path.unlink(missing_ok=True)
+                    report['deleted_files'] += 1
+            if not dry_run:
+                # Drop on-demand transforms of the deleted upload as well
+                for cached in IMAGE_CACHE_DIR.glob(f"{file_id}_*"):
+                    cached.unlink(missing_ok=True)
+        if not dry_run:
+            await db.image_assets.delete_many({'file_id': {'$in': batch}})
+        # Let other requests run between batches
+        await asyncio.sleep(0)
+    
+    logging.info(f"Upload GC{' (dry run)' if dry_run else ''}: {len(orphaned)} orphaned uploads, {report['bytes_reclaimed']} bytes")
+    return report
+
+# On-demand resized copies (/api/images/{file_id}) kept in a size-bounded LRU disk cache.
+# Uploads are immutable, so a cached transform never goes stale.
+IMAGE_CACHE_DIR = Path(os.environ.get('IMAGE_CACHE_DIR', str(ROOT_DIR / 'image_cache')))
+IMAGE_CACHE_MAX_BYTES = int(os.environ.get('IMAGE_CACHE_MAX_MB', '256')) * 1024 * 1024
+IMAGE_TRANSFORM_MAX_DIMENSION = 2000
+FILE_ID_PATTERN = re.compile(r'^[0-9A-Za-z-]+$')
+
+class DiskLRUCache:
+    """Files in a directory, evicted least recently used first once over max_bytes.
+    
+    Usage is recomputed from the directory itself when evicting, so every worker process shares
+    one cache and one limit. Hits touch the file's mtime, which is the recency order. File IO
+    runs in a thread, and the directory is only rescanned once this process's estimate of the
+    usage (the last scan plus its own writes since) goes over the limit.
+    """
+    
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.estimated_bytes: Optional[int] = None
+    
+    async def get(self, name: str) -> Optional[bytes]:
+        """Cached bytes, or None on a miss (including files another worker just evicted)"""
+        return await asyncio.to_thread(self.read, name)
+    
+    async def put(self, name: str, data: bytes) -> bytes:
+        await asyncio.to_thread(self.write, name, data)
+        if self.estimated_bytes is not None and self.estimated_bytes + len(data) <= self.max_bytes:
+            self.estimated_bytes += len(data)
+        else:
+            self.estimated_bytes = await asyncio.to_thread(self.evict)
+        return data
+    
+    def read(self, name: str) -> Optional[bytes]:
+        path = self.directory / name
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return data
+    
+    def write(self, name: str, data: bytes):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.directory / f".{name}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, self.directory / name)
+    
+    def evict(self) -> int:
+        """Delete the least recently used files until the directory is back under max_bytes; return its usage"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            try:
+                if entry.is_file() and not entry.name.startswith('.'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+            except FileNotFoundError:
+                # Evicted by another worker while scanning
+                continue
+        total_bytes = sum(size for _, _, size in entries)
+        # Always keep the most recent file, even if it alone is over the limit
+        for _, name, size in sorted(entries)[:-1]:
+            if total_bytes <= self.max_bytes:
+                break
+            (self.directory / name).unlink(missing_ok=True)
+            total_bytes -= size
+        return total_bytes
+
+image_cache = DiskLRUCache(IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_BYTES)
+
+def transform_source_path(file_id: str) -> Optional[Path]:
+    """Best source for an on-demand transform: the largest stored JPEG variant, else the main image"""
+    variants = []
+    for path in uploads_dir.glob(f"{file_id}_*.jpg"):
+        match = re.fullmatch(rf"{re.escape(file_id)}_(\d+)\.jpg", path.name)
+        if match:
+            variants.append((int(match.group(1)), path))
+    if variants:
+        return max(variants)[1]
+    main = uploads_dir / f"{file_id}.jpg"
+    return main if main.is_file() else None
+
+async def render_cached_transform(source: Path, cache_name: str, width: int, height: int, fmt: str) -> bytes:
+    """Resize in the transform worker pool and store in the cache"""
+    data = await transform_image_queue.run(resize_image, str(source), width, height, 85, fmt)
+    return await image_cache.put(cache_name, data)
+
 @api_router.post("/upload/image")
 async def upload_image(file: UploadFile = File(...), current_user: User = Depends(get_admin_user)):
     if not file.content_type.startswith('image/'):
         raise HTTPException(status_code=400, detail="File must be an image")
     
-    # Read and resize image
-    content = await file.read()
-    resized_content = resize_image(content)
-    
-    # Save file
-    file_id = str(uuid.uuid4())
-    file_path = uploads_dir / f"{file_id}.jpg"
-    with open(file_path, 'wb') as f:
-        f.write(resized_content)
-    
-    # Return base64 encoded image for immediate use
-    image_base64 = base64.b64encode(resized_content).decode('utf-8')
-    image_url = f"data:image/jpeg;base64,{image_base64}"
-    
-    return {"url": image_url, "file_id": file_id}
+    # Hash, resize and save the image with its responsive variants
+    source_hash = await hash_upload(file)
+    asset = await store_uploaded_image(file, source_hash)
+    return image_asset_response(asset)
 
 @api_router.post("/upload/featured-image")
 async def upload_featured_image(file: UploadFile = File(...), current_user: User = Depends(get_admin_user)):
@@ -999,79 +2931,311 @@ async def upload_featured_image(file: UploadFile = File(...), current_user: User
     if not file.content_type.startswith('image/'):
         raise HTTPException(status_code=400, detail="File must be an image")
     
-    from PIL import Image
-    import io
+    # Hash, resize and save the image with its responsive variants
+    source_hash = await hash_upload(file)
+    asset = await store_uploaded_image(file, source_hash, 800, 600)
+    return image_asset_response(asset)
+
+@api_router.get("/uploads/{filename}")
+async def get_uploaded_file(filename: str):
+    """Serve an uploaded image with long-lived cache headers"""
+    if not UPLOAD_FILENAME_PATTERN.match(filename):
+        raise HTTPException(status_code=404, detail="File not found")
     
-    # Read image
-    content = await file.read()
-    img = Image.open(io.BytesIO(content))
+    file_path = uploads_dir / filename
+    if not file_path.is_file():
+        raise HTTPException(status_code=404, detail="File not found")
     
-    # Get dimensions
-    width, height = img.size
-    target_width, target_height = 800, 600
+    media_type = 'image/webp' if filename.endswith('.webp') else 'image/jpeg'
+    return FileResponse(file_path, media_type=media_type, headers={'Cache-Control': UPLOAD_CACHE_CONTROL})
+
+@api_router.get("/images/{file_id}")
+async def get_transformed_image(file_id: str, request: Request, w: Optional[int] = None, h: Optional[int] = None, fmt: str = 'jpeg'):
+    """Serve an uploaded image resized to fit w x h (never upscaled) as JPEG or WebP"""
+    if not FILE_ID_PATTERN.match(file_id):
+        raise HTTPException(status_code=404, detail="Image not found")
+    if fmt not in IMAGE_VARIANT_FORMATS:
+        raise HTTPException(status_code=400, detail="fmt must be jpeg or webp")
+    if w is None and h is None:
+        raise HTTPException(status_code=400, detail="Specify w and/or h")
+    width = w or IMAGE_TRANSFORM_MAX_DIMENSION
+    height = h or IMAGE_TRANSFORM_MAX_DIMENSION
+    if not (0 < width <= IMAGE_TRANSFORM_MAX_DIMENSION and 0 < height <= IMAGE_TRANSFORM_MAX_DIMENSION):
+        raise HTTPException(status_code=400, detail=f"w and h must be between 1 and {IMAGE_TRANSFORM_MAX_DIMENSION}")
     
-    # Only resize if bigger than target
-    if width > target_width or height > target_height:
-        # Calculate aspect ratio
-        aspect = width / height
-        target_aspect = target_width / target_height
-        
-        if aspect > target_aspect:
-            # Width is the limiting factor
-            new_width = target_width
-            new_height = int(target_width / aspect)
-        else:
-            # Height is the limiting factor
-            new_height = target_height
-            new_width = int(target_height * aspect)
-        
-        img = img.resize((new_width, new_height), Image.LANCZOS)
+    cache_name = f"{file_id}_{width}x{height}.{IMAGE_VARIANT_FORMATS[fmt]}"
+    etag = f'"{cache_name}"'
+    headers = {'ETag': etag, 'Cache-Control': UPLOAD_CACHE_CONTROL}
+    media_type = f"image/{fmt}"
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers=headers)
     
-    # Convert to JPEG
-    output = io.BytesIO()
-    if img.mode in ('RGBA', 'LA', 'P'):
-        img = img.convert('RGB')
-    img.save(output, format='JPEG', quality=85)
-    resized_content = output.getvalue()
+    # Serve the bytes read here rather than the path: another worker may evict the file meanwhile
+    data = await image_cache.get(cache_name)
+    if data is None:
+        source = transform_source_path(file_id)
+        if source is None:
+            raise HTTPException(status_code=404, detail="Image not found")
+        # Concurrent requests for the same transform share one render
+        data = await single_flight(f"image:{cache_name}", lambda: render_cached_transform(source, cache_name, width, height, fmt))
     
-    # Save file
-    file_id = str(uuid.uuid4())
-    file_path = uploads_dir / f"{file_id}.jpg"
-    with open(file_path, 'wb') as f:
-        f.write(resized_content)
+    return Response(content=data, media_type=media_type, headers=headers)
+
+@api_router.get("/image-assets/{file_id}")
+async def get_image_asset(file_id: str):
+    """URLs and srcset strings for an uploaded image's responsive variants"""
+    asset = await db.image_assets.find_one({'file_id': file_id})
+    if not asset:
+        raise HTTPException(status_code=404, detail="Image not found")
+    return image_asset_response(asset)
+
+@api_router.post("/admin/images/migrate-inline", status_code=202)
+async def migrate_inline_images_endpoint(batch_size: int = 50, current_user: User = Depends(get_admin_user)):
+    """Start a background job converting inline base64 images in content documents to uploaded files"""
+    batch_size = max(1, min(batch_size, 500))
+    return await start_maintenance_job('inline_image_migration', current_user, migrate_inline_images, batch_size)
+
+async def drop_image_ref_counts() -> dict:
+    """Remove the old ref_count field (an upload counter, not a reference count) from image assets"""
+    result = await db.image_assets.update_many({'ref_count': {'$exists': True}}, {'$unset': {'ref_count': ''}})
+    return {'updated': result.modified_count}
+
+@api_router.post("/admin/images/drop-ref-counts", status_code=202)
+async def drop_image_ref_counts_endpoint(current_user: User = Depends(get_admin_user)):
+    """Start a one-off job clearing ref_count from image assets (the GC's reference scan replaces it)"""
+    return await start_maintenance_job('image_ref_count_cleanup', current_user, drop_image_ref_counts)
+
+@api_router.post("/admin/uploads/gc")
+async def collect_orphaned_uploads_endpoint(dry_run: bool = True, grace_hours: float = UPLOAD_GC_GRACE_HOURS, current_user: User = Depends(get_admin_user)):
+    """Find unreferenced uploads older than the grace period; deletes them only with dry_run=false"""
+    if grace_hours < 1:
+        raise HTTPException(status_code=400, detail="grace_hours must be at least 1")
+    report = await collect_orphaned_uploads(grace_hours, dry_run)
+    verb = "Would reclaim" if dry_run else "Reclaimed"
+    return {
+        "message": f"{verb} {report['bytes_reclaimed'] / (1024 * 1024):.1f} MB from {report['orphaned_uploads']} orphaned uploads",
+        **report
+    }
+
+# Publication imports run as background jobs (import_jobs collection) so the upload request returns at once
+RIS_MAX_UPLOAD_BYTES = int(os.environ.get('RIS_MAX_UPLOAD_MB', '200')) * 1024 * 1024
+IMPORT_JOB_CONCURRENCY = int(os.environ.get('IMPORT_JOB_CONCURRENCY', '1'))
+# Each worker heartbeats the jobs it owns (queued ones included); a job whose heartbeat is
+# older than IMPORT_JOB_STALE_MINUTES belongs to a worker that has stopped. Admin maintenance
+# tasks (maintenance_jobs collection) are owned and swept the same way.
+BACKGROUND_JOB_COLLECTIONS = ('import_jobs', 'maintenance_jobs')
+IMPORT_JOB_HEARTBEAT_SECONDS = 30
+IMPORT_JOB_STALE_MINUTES = 2
+_import_semaphore = asyncio.Semaphore(IMPORT_JOB_CONCURRENCY)
+_background_tasks: set = set()
+_job_heartbeat_task: Optional[asyncio.Task] = None
+
+# Import formats: expected file extension and streaming record parser
+PUBLICATION_IMPORT_FORMATS = {
+    'ris': ('.ris', iter_ris_records),
+    'bibtex': ('.bib', iter_bibtex_records),
+    'csl-json': ('.json', iter_csl_json_records)
+}
+
+async def run_import_job(job_id: str, path: str, filename: str, fmt: str = 'ris'):
+    """Import a spooled publications file, recording progress on the job document after every batch"""
+    errors: List[str] = []
     
-    # Return base64 encoded image
-    image_base64 = base64.b64encode(resized_content).decode('utf-8')
-    image_url = f"data:image/jpeg;base64,{image_base64}"
+    async def record_progress(report: dict, **fields):
+        await db.import_jobs.update_one({'id': job_id}, {'$set': {
+            **report,
+            'parsed': report['inserted'] + report['matched'] + report['skipped'],
+            'errors': errors[:50],
+            'error_count': len(errors),
+            'updated_at': datetime.now(timezone.utc),
+            **fields
+        }})
     
-    return {"url": image_url, "file_id": file_id}
+    try:
+        async with _import_semaphore:
+            claimed = await db.import_jobs.update_one({'id': job_id, 'status': 'queued'}, {'$set': {
+                'status': 'running', 'started_at': datetime.now(timezone.utc), 'updated_at': datetime.now(timezone.utc)
+            }})
+            if not claimed.matched_count:
+                logging.warning(f"Import job {job_id} is no longer queued, not running it")
+                return
+            with open(path, 'rb') as f:
+                parse_records = PUBLICATION_IMPORT_FORMATS[fmt][1]
+                records = parse_records(UploadFile(file=f, filename=filename), errors)
+                report = await import_publications(records, record_progress)
+            await record_progress(report, status='completed', finished_at=datetime.now(timezone.utc))
+            logging.info(f"Import job {job_id} finished: {report}")
+    except Exception as e:
+        logging.error(f"Import job {job_id} failed: {e}")
+        errors.append(str(e))
+        job = await db.import_jobs.find_one({'id': job_id}) or {}
+        report = {key: job.get(key, 0) for key in ('inserted', 'matched', 'skipped')}
+        await record_progress(report, status='failed', finished_at=datetime.now(timezone.utc))
+    finally:
+        os.remove(path)
+
+def import_job_response(job: dict) -> dict:
+    job.pop('_id', None)
+    started, finished = job.get('started_at'), job.get('finished_at') or datetime.now(timezone.utc)
+    elapsed = (as_utc(finished) - as_utc(started)).total_seconds() if started else 0
+    job['elapsed_seconds'] = round(elapsed, 1)
+    job['records_per_second'] = round(job.get('parsed', 0) / elapsed, 1) if elapsed > 0 else None
+    return job
+
+async def fail_stale_jobs():
+    """Mark background jobs left queued/running by a worker that stopped (no recent heartbeat) as failed"""
+    cutoff = datetime.now(timezone.utc) - timedelta(minutes=IMPORT_JOB_STALE_MINUTES)
+    for collection_name in BACKGROUND_JOB_COLLECTIONS:
+        await db[collection_name].update_many(
+            {
+                'status': {'$in': ['queued', 'running']},
+                'owner': {'$ne': WORKER_ID},
+                '$or': [
+                    {'heartbeat_at': {'$lt': cutoff}},
+                    # Jobs created before heartbeats were recorded
+                    {'heartbeat_at': {'$exists': False}, 'updated_at': {'$lt': cutoff}}
+                ]
+            },
+            {'$set': {'status': 'failed', 'finished_at': datetime.now(timezone.utc)}, '$push': {'errors': 'Interrupted by a server restart'}}
+        )
 
-@api_router.post("/upload/ris")
-async def upload_ris_file(file: UploadFile = File(...), current_user: User = Depends(get_admin_user)):
-    if not file.filename.endswith('.ris'):
-        raise HTTPException(status_code=400, detail="File must be a RIS file")
+async def run_job_heartbeat():
+    """Keep this worker's queued and running jobs alive, and fail jobs orphaned by other workers"""
+    while True:
+        try:
+            for collection_name in BACKGROUND_JOB_COLLECTIONS:
+                await db[collection_name].update_many(
+                    {'owner': WORKER_ID, 'status': {'$in': ['queued', 'running']}},
+                    {'$set': {'heartbeat_at': datetime.now(timezone.utc)}}
+                )
+            await fail_stale_jobs()
+        except Exception as e:
+            logging.error(f"Background job heartbeat failed: {e}")
+        await asyncio.sleep(IMPORT_JOB_HEARTBEAT_SECONDS)
+
+async def run_maintenance_job(job_id: str, task: Callable[..., Awaitable[dict]], *args):
+    """Run an admin maintenance task for a queued job and store its report on the job document"""
+    claimed = await db.maintenance_jobs.update_one({'id': job_id, 'status': 'queued'}, {'$set': {
+        'status': 'running', 'started_at': datetime.now(timezone.utc), 'updated_at': datetime.now(timezone.utc)
+    }})
+    if not claimed.matched_count:
+        return
+    try:
+        report = await task(*args)
+        fields = {'status': 'completed', 'report': report}
+    except Exception as e:
+        logging.error(f"Maintenance job {job_id} failed: {e}")
+        fields = {'status': 'failed', 'errors': [str(e)]}
+    await db.maintenance_jobs.update_one({'id': job_id}, {'$set': {
+        **fields, 'finished_at': datetime.now(timezone.utc), 'updated_at': datetime.now(timezone.utc)
+    }})
+
+async def start_maintenance_job(job_type: str, current_user: User, task: Callable[..., Awaitable[dict]], *args) -> dict:
+    """Start a background maintenance job unless one of the same type is already in progress"""
+    active = await db.maintenance_jobs.find_one({'type': job_type, 'status': {'$in': ['queued', 'running']}})
+    if active:
+        raise HTTPException(status_code=409, detail=f"A {job_type} job is already in progress ({active['id']})")
     
-    # Read and parse RIS file
-    content = await file.read()
-    content_str = content.decode('utf-8')
+    job = {
+        'id': str(uuid.uuid4()),
+        'type': job_type,
+        'status': 'queued',
+        'report': None,
+        'errors': [],
+        'created_by': current_user.id,
+        'owner': WORKER_ID,
+        'created_at': datetime.now(timezone.utc),
+        'updated_at': datetime.now(timezone.utc),
+        'heartbeat_at': datetime.now(timezone.utc),
+        'started_at': None,
+        'finished_at': None
+    }
+    await db.maintenance_jobs.insert_one(job)
     
-    publications = parse_ris_file(content_str)
+    task_handle = asyncio.create_task(run_maintenance_job(job['id'], task, *args))
+    _background_tasks.add(task_handle)
+    task_handle.add_done_callback(_background_tasks.discard)
     
-    # Save publications to database
-    for pub_data in publications:
-        pub_dict = pub_data.copy()
-        pub_dict['id'] = str(uuid.uuid4())
-        pub_dict['created_at'] = datetime.now(timezone.utc)
-        
-        # Insert if not exists (check by title and year)
-        existing = await db.static_publications.find_one({
-            'title': pub_dict['title'],
-            'year': pub_dict['year']
-        })
-        if not existing:
-            await db.static_publications.insert_one(pub_dict)
+    return {
+        "message": f"Started {job_type} job",
+        "job_id": job['id'],
+        "status_url": f"/api/admin/maintenance-jobs/{job['id']}"
+    }
+
+async def start_import_job(file: UploadFile, fmt: str, current_user: User) -> dict:
+    """Spool an uploaded publications file and start a background import job for it"""
+    # Keep a copy of the file for the background job (the upload is gone once we respond)
+    path, _ = await spool_upload(file, RIS_MAX_UPLOAD_BYTES)
+    
+    job = {
+        'id': str(uuid.uuid4()),
+        'type': f"{fmt.replace('-', '_')}_import",
+        'format': fmt,
+        'filename': file.filename,
+        'status': 'queued',
+        'parsed': 0,
+        'inserted': 0,
+        'matched': 0,
+        'skipped': 0,
+        'errors': [],
+        'error_count': 0,
+        'created_by': current_user.id,
+        'owner': WORKER_ID,
+        'created_at': datetime.now(timezone.utc),
+        'updated_at': datetime.now(timezone.utc),
+        'heartbeat_at': datetime.now(timezone.utc),
+        'started_at': None,
+        'finished_at': None
+    }
+    await db.import_jobs.insert_one(job)
+    
+    task = asyncio.create_task(run_import_job(job['id'], path, file.filename, fmt))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
     
-    return {"message": f"Successfully parsed and saved {len(publications)} publications"}
+    return {
+        "message": f"Import of {file.filename} started",
+        "job_id": job['id'],
+        "status_url": f"/api/admin/import-jobs/{job['id']}"
+    }
+
+@api_router.post("/upload/ris", status_code=202)
+async def upload_ris_file(file: UploadFile = File(...), current_user: User = Depends(get_admin_user)):
+    if not file.filename.endswith('.ris'):
+        raise HTTPException(status_code=400, detail="File must be a RIS file")
+    return await start_import_job(file, 'ris', current_user)
+
+@api_router.post("/upload/bibtex", status_code=202)
+async def upload_bibtex_file(file: UploadFile = File(...), current_user: User = Depends(get_admin_user)):
+    if not file.filename.endswith('.bib'):
+        raise HTTPException(status_code=400, detail="File must be a BibTeX (.bib) file")
+    return await start_import_job(file, 'bibtex', current_user)
+
+@api_router.post("/upload/csl-json", status_code=202)
+async def upload_csl_json_file(file: UploadFile = File(...), current_user: User = Depends(get_admin_user)):
+    if not file.filename.endswith('.json'):
+        raise HTTPException(status_code=400, detail="File must be a CSL-JSON (.json) file")
+    return await start_import_job(file, 'csl-json', current_user)
+
+@api_router.get("/admin/import-jobs")
+async def list_import_jobs(limit: int = Query(20, ge=1, le=100), current_user: User = Depends(get_admin_user)):
+    jobs = await db.import_jobs.find({}).sort('created_at', -1).limit(limit).to_list(limit)
+    return [import_job_response(job) for job in jobs]
+
+@api_router.get("/admin/import-jobs/{job_id}")
+async def get_import_job(job_id: str, current_user: User = Depends(get_admin_user)):
+    job = await db.import_jobs.find_one({'id': job_id})
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return import_job_response(job)
+
+@api_router.get("/admin/maintenance-jobs/{job_id}")
+async def get_maintenance_job(job_id: str, current_user: User = Depends(get_admin_user)):
+    job = await db.maintenance_jobs.find_one({'id': job_id})
+    if not job:
+        raise HTTPException(status_code=404, detail="Maintenance job not found")
+    job.pop('_id', None)
+    return job
 
 # Site settings endpoints
 @api_router.get("/settings")
@@ -1096,16 +3260,17 @@ async def update_site_settings(settings: SiteSettings, current_user: User = Depe
 @api_router.get("/team", response_model=List[TeamMember])
 async def get_team_members():
     members = await db.team_members.find({}).sort('order_index', 1).to_list(100)
+    await attach_srcsets(members, 'photo_url', 'photo_srcset')
     return [TeamMember(**member) for member in members]
 
 @api_router.post("/admin/team", response_model=TeamMember)
 async def create_team_member(member: TeamMember, current_user: User = Depends(get_admin_user)):
-    await db.team_members.insert_one(member.dict())
+    await db.team_members.insert_one(member.dict(exclude={'photo_srcset'}))
     return member
 
 @api_router.put("/admin/team/{member_id}", response_model=TeamMember)
 async def update_team_member(member_id: str, member: TeamMember, current_user: User = Depends(get_admin_user)):
-    result = await db.team_members.replace_one({'id': member_id}, member.dict())
+    result = await db.team_members.replace_one({'id': member_id}, member.dict(exclude={'photo_srcset'}))
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Team member not found")
     return member
@@ -1231,6 +3396,7 @@ async def delete_intellectual_property(ip_id: str, current_user: User = Depends(
 @api_router.get("/research-highlights", response_model=List[ResearchHighlight])
 async def get_research_highlights():
     highlights = await db.research_highlights.find({}).sort([('is_featured', -1), ('order_index', 1)]).to_list(100)
+    await attach_srcsets(highlights, 'image_url', 'image_srcset')
     result = []
     for highlight in highlights:
         highlight.pop('_id', None)
@@ -1239,12 +3405,12 @@ async def get_research_highlights():
 
 @api_router.post("/admin/research-highlights", response_model=ResearchHighlight)
 async def create_research_highlight(highlight: ResearchHighlight, current_user: User = Depends(get_admin_user)):
-    await db.research_highlights.insert_one(highlight.dict())
+    await db.research_highlights.insert_one(highlight.dict(exclude={'image_srcset'}))
     return highlight
 
 @api_router.put("/admin/research-highlights/{highlight_id}", response_model=ResearchHighlight)
 async def update_research_highlight(highlight_id: str, highlight: ResearchHighlight, current_user: User = Depends(get_admin_user)):
-    result = await db.research_highlights.replace_one({'id': highlight_id}, highlight.dict())
+    result = await db.research_highlights.replace_one({'id': highlight_id}, highlight.dict(exclude={'image_srcset'}))
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Research highlight not found")
     return highlight
@@ -1258,17 +3424,49 @@ async def delete_research_highlight(highlight_id: str, current_user: User = Depe
 
 # Static publications endpoints
 @api_router.get("/static-publications", response_model=List[StaticPublication])
-async def get_static_publications(limit: int = 50):
+async def get_static_publications(limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE)):
     publications = await db.static_publications.find({}).sort('year', -1).limit(limit).to_list(limit)
     return [StaticPublication(**pub) for pub in publications]
 
+@api_router.get("/static-publications/export")
+async def export_static_publications(format: str = 'bibtex'):
+    """Download all publications as BibTeX or CSL-JSON, streamed in chunks"""
+    if format not in PUBLICATION_EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="format must be bibtex or csl-json")
+    media_type, extension = PUBLICATION_EXPORT_FORMATS[format]
+    return StreamingResponse(
+        stream_publications_export(format),
+        media_type=media_type,
+        headers={'Content-Disposition': f'attachment; filename="publications.{extension}"'}
+    )
+
 @api_router.post("/admin/static-publications", response_model=StaticPublication)
 async def create_static_publication(pub: StaticPublication, current_user: User = Depends(get_admin_user)):
     pub_dict = pub.dict()
     pub_dict['created_at'] = datetime.now(timezone.utc)
-    await db.static_publications.insert_one(pub_dict)
+    pub_dict['dedup_key'] = publication_dedup_key(pub_dict)
+    pub_dict.update(near_duplicate_fields(pub_dict))
+    if normalize_doi(pub.doi):
+        pub_dict['doi_key'] = normalize_doi(pub.doi)
+    try:
+        await db.static_publications.insert_one(pub_dict)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="A publication with this title and year already exists")
     return pub
 
+@api_router.get("/admin/static-publications/duplicates")
+async def get_duplicate_publications(threshold: float = NEAR_DUPLICATE_THRESHOLD, current_user: User = Depends(get_admin_user)):
+    """Clusters of publications that are likely duplicates (near-identical titles and authors)"""
+    if not 0.5 <= threshold <= 1:
+        raise HTTPException(status_code=400, detail="threshold must be between 0.5 and 1")
+    clusters = await find_duplicate_clusters(threshold)
+    return {
+        'threshold': threshold,
+        'cluster_count': len(clusters),
+        'duplicate_count': sum(cluster['size'] - 1 for cluster in clusters),
+        'clusters': clusters
+    }
+
 @api_router.delete("/admin/static-publications/{publication_id}")
 async def delete_static_publication(publication_id: str, current_user: User = Depends(get_admin_user)):
     result = await db.static_publications.delete_one({'id': publication_id})
@@ -1280,14 +3478,15 @@ async def delete_static_publication(publication_id: str, current_user: User = De
 # News endpoints (enhanced)
 @api_router.post("/admin/news", response_model=NewsArticle)
 async def create_news_article(article: NewsArticle, current_user: User = Depends(get_admin_user)):
-    article_dict = article.dict()
+    article_dict = article.dict(exclude={'image_srcset'})
     article_dict['created_by'] = current_user.id
     await db.news.insert_one(article_dict)
     return article
 
 @api_router.get("/news", response_model=List[NewsArticle])
-async def get_news_articles(limit: int = 10):
+async def get_news_articles(limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE)):
     news_articles = await db.news.find({'is_published': True}).sort('created_at', -1).limit(limit).to_list(limit)
+    await attach_srcsets(news_articles, 'image_url', 'image_srcset')
     return [NewsArticle(**article) for article in news_articles]
 
 @api_router.get("/news/featured")
@@ -1295,12 +3494,13 @@ async def get_featured_news():
     featured = await db.news.find_one({'is_featured': True, 'is_published': True}, sort=[('created_at', -1)])
     if featured:
         featured.pop('_id', None)
+        await attach_srcsets([featured], 'image_url', 'image_srcset')
         return NewsArticle(**featured)
     return None
 
 @api_router.put("/admin/news/{news_id}")
 async def update_news_article(news_id: str, article: NewsArticle, current_user: User = Depends(get_admin_user)):
-    article_dict = article.dict()
+    article_dict = article.dict(exclude={'image_srcset'})
     article_dict['updated_at'] = datetime.now(timezone.utc)
     result = await db.news.replace_one({'id': news_id}, article_dict)
     if result.matched_count == 0:
@@ -1366,24 +3566,147 @@ async def root():
 
 @api_router.get("/citations", response_model=CitationMetrics)
 async def get_citation_metrics():
-    scholar_data = fetch_google_scholar_data("7pUFcrsAAAAJ")
+    scholar_data = await get_cached_scholar_data()
     return CitationMetrics(**scholar_data)
 
+@api_router.get("/team/metrics", response_model=List[MemberMetrics])
+async def get_team_metrics():
+    members = await db.team_members.find(ACTIVE_MEMBERS_WITH_PROFILES, {'id': 1}).to_list(1000)
+    metrics = await db.team_metrics.find({'member_id': {'$in': [m['id'] for m in members]}}).to_list(1000)
+    return [MemberMetrics(**m) for m in metrics]
+
 @api_router.get("/publications", response_model=List[Publication])
-async def get_publications(limit: int = 10):
+async def get_publications(limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE), offset: int = Query(0, ge=0), year: Optional[int] = None):
     # Get SCOPUS author ID from settings
     settings = await db.site_settings.find_one({}) or {}
     scopus_id = settings.get('scopus_author_id', '22133247800')
     
-    scopus_data = fetch_scopus_publications_api(scopus_id, limit)
-    publications = []
+    # Filter and paginate the cached bibliography locally
+    scopus_data = await get_cached_scopus_publications(scopus_id, limit, offset, year)
+    return [Publication(**pub_data) for pub_data in scopus_data]
+
+@api_router.post("/admin/scopus/ingest")
+async def ingest_scopus_publications(current_user: User = Depends(get_admin_user)):
+    settings = await db.site_settings.find_one({}) or {}
+    scopus_id = settings.get('scopus_author_id', '22133247800')
     
-    for pub_data in scopus_data:
-        pub_dict = pub_data.copy()
-        pub_dict['id'] = str(uuid.uuid4())
-        publications.append(Publication(**pub_dict))
+    entry = await refresh_scopus_cache(scopus_id)
+    if not entry:
+        raise HTTPException(status_code=502, detail="Could not fetch publications from Scopus")
+    return {
+        "message": f"Synced {entry['count']} publications for author {scopus_id}",
+        "complete": entry['complete'],
+        **entry['last_sync']
+    }
+
+@api_router.get("/admin/source-health")
+async def get_source_health(current_user: User = Depends(get_admin_user)):
+    """Source health across all workers, merged from the snapshot each worker stores"""
+    await save_source_health_snapshot()
+    snapshots = await db.source_health.find({}).to_list(None)
+    now = datetime.now(timezone.utc)
+    # Workers that missed a few snapshots have stopped: their counts still add up, but their
+    # circuit breaker state no longer applies
+    live_cutoff = now - timedelta(seconds=SOURCE_HEALTH_SNAPSHOT_SECONDS * 3)
     
-    return publications
+    served = {}
+    for snapshot in snapshots:
+        for product, entry in snapshot.get('served', {}).items():
+            merged = served.setdefault(product, {'counts': {'live': 0, 'cache': 0, 'fallback': 0}, 'last_origin': None, 'last_served': None})
+            for origin, count in entry['counts'].items():
+                merged['counts'][origin] += count
+            if entry.get('last_served') and (merged['last_served'] is None or as_utc(entry['last_served']) > as_utc(merged['last_served'])):
+                merged['last_origin'], merged['last_served'] = entry['last_origin'], entry['last_served']
+    
+    return {
+        'worker_id': WORKER_ID,
+        'workers': [
+            {
+                'worker_id': snapshot['_id'],
+                'snapshot_at': snapshot['snapshot_at'],
+                'snapshot_age_seconds': round((now - as_utc(snapshot['snapshot_at'])).total_seconds(), 1),
+                'live': as_utc(snapshot['snapshot_at']) >= live_cutoff
+            }
+            for snapshot in snapshots
+        ],
+        'oldest_snapshot_age_seconds': max(
+            (round((now - as_utc(snapshot['snapshot_at'])).total_seconds(), 1) for snapshot in snapshots), default=None
+        ),
+        'sources': {
+            name: merge_source_health([snapshot['sources'][name] for snapshot in snapshots if name in snapshot.get('sources', {})])
+            for name in source_health
+        },
+        'scholar_circuit_open': any(
+            snapshot.get('scholar_circuit_open') for snapshot in snapshots if as_utc(snapshot['snapshot_at']) >= live_cutoff
+        ),
+        'served': served
+    }
+
+@api_router.get("/admin/refresh-status")
+async def get_refresh_status(current_user: User = Depends(get_admin_user)):
+    state = await db.scheduler_locks.find_one({'_id': REFRESH_LEASE_ID}) or {}
+    return {
+        'last_run': state.get('last_run'),
+        'next_run': _refresh_state['next_run'],
+        'lease_owner': state.get('owner'),
+        'lease_expires_at': state.get('expires_at'),
+        'worker_id': WORKER_ID,
+        'interval_minutes': SOURCE_REFRESH_INTERVAL_MINUTES,
+        'jitter_seconds': SOURCE_REFRESH_JITTER_SECONDS,
+        'sources': state.get('sources', {})
+    }
+
+class UploadSizeLimitMiddleware:
+    """Reject upload request bodies over a per-path limit while they stream in.
+    
+    Content-Length is checked up front; chunked bodies without one are counted as they are
+    received, so an oversized upload is cut off before Starlette has spooled all of it.
+    """
+    
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+    
+    async def __call__(self, scope, receive, send):
+        max_bytes = self.limits.get(scope['path']) if scope['type'] == 'http' else None
+        if max_bytes is None:
+            return await self.app(scope, receive, send)
+        
+        error = upload_too_large(max_bytes - UPLOAD_MULTIPART_SLACK_BYTES)
+        length = dict(scope['headers']).get(b'content-length', b'')
+        if length.isdigit() and int(length) > max_bytes:
+            return await JSONResponse(status_code=error.status_code, content={'detail': error.detail})(scope, receive, send)
+        
+        received = 0
+        response_started = False
+        
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message['type'] == 'http.request':
+                received += len(message.get('body', b''))
+                if received > max_bytes:
+                    # Raised inside form parsing, so FastAPI answers with this 413
+                    raise error
+            return message
+        
+        async def tracked_send(message):
+            nonlocal response_started
+            if message['type'] == 'http.response.start':
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, limited_receive, tracked_send)
+        except HTTPException as e:
+            if e is not error or response_started:
+                raise
+            await JSONResponse(status_code=error.status_code, content={'detail': error.detail})(scope, receive, send)
+
+app.add_middleware(UploadSizeLimitMiddleware, limits={
+    **{path: MAX_UPLOAD_BYTES + UPLOAD_MULTIPART_SLACK_BYTES for path in IMAGE_UPLOAD_PATHS},
+    **{f"/api/upload/{fmt}": RIS_MAX_UPLOAD_BYTES + UPLOAD_MULTIPART_SLACK_BYTES for fmt in PUBLICATION_IMPORT_FORMATS}
+})
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -1405,9 +3728,41 @@ logger = logging.getLogger(__name__)
 
 @app.on_event("startup")
 async def startup_event():
+    global _refresh_task, _job_heartbeat_task, _health_snapshot_task
     await initialize_default_data()
+    await db.scopus_cache.create_index('author_id', unique=True)
+    await db.scopus_publications.create_index([('author_id', 1), ('key', 1)], unique=True)
+    await db.scopus_publications.create_index([('author_id', 1), ('year', -1)])
+    await db.team_metrics.create_index('member_id', unique=True)
+    await db.scholar_cache.create_index('scholar_id', unique=True)
+    await db.image_assets.create_index('file_id', unique=True)
+    await backfill_publication_dedup_keys()
+    await db.static_publications.create_index(
+        'dedup_key', unique=True, partialFilterExpression={'dedup_key': {'$type': 'string'}}
+    )
+    await db.static_publications.create_index('doi_key', partialFilterExpression={'doi_key': {'$type': 'string'}})
+    await db.static_publications.create_index('lsh_bands')
+    await db.import_jobs.create_index('id', unique=True)
+    await db.import_jobs.create_index('created_at')
+    await db.import_jobs.create_index([('status', 1), ('heartbeat_at', 1)])
+    await db.maintenance_jobs.create_index('id', unique=True)
+    _job_heartbeat_task = asyncio.create_task(run_job_heartbeat())
+    await db.image_assets.create_index('source_keys')
+    _refresh_task = asyncio.create_task(run_refresh_scheduler())
+    await db.source_health.create_index('snapshot_at', expireAfterSeconds=int(SOURCE_HEALTH_SNAPSHOT_TTL_HOURS * 3600))
+    _health_snapshot_task = asyncio.create_task(run_source_health_snapshots())
     logger.info("Application started and database initialized")
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+    if _health_snapshot_task is not None:
+        _health_snapshot_task.cancel()
+    if _job_heartbeat_task is not None:
+        _job_heartbeat_task.cancel()
     client.close()
+    if _http_client is not None:
+        await _http_client.aclose()
+    upload_image_queue.shutdown()
+    transform_image_queue.shutdown()
@@ -571,11 +571,18 @@ const HomePage = () => {
                   <Card className="overflow-hidden h-full">
                     {featuredNews.image_url && (
                       <div className="aspect-video">
-                        <img 
-                          src={featuredNews.image_url} 
-                          alt={featuredNews.title}
-                          className="w-full h-full object-cover"
-                        />
+                        <picture className="contents">
+                          {featuredNews.image_srcset?.webp && (
+                            <source type="image/webp" srcSet={featuredNews.image_srcset.webp} sizes="(min-width: 1024px) 50vw, 100vw" />
+                          )}
+                          <img 
+                            src={featuredNews.image_url} 
+                            srcSet={featuredNews.image_srcset?.jpeg}
+                            sizes="(min-width: 1024px) 50vw, 100vw"
+                            alt={featuredNews.title}
+                            className="w-full h-full object-cover"
+                          />
+                        </picture>
                       </div>
                     )}
                     <CardContent className="p-6">
@@ -613,11 +620,18 @@ const HomePage = () => {
                 <Card key={highlight.id} className="hover:shadow-lg transition-shadow">
                   {highlight.image_url && (
                     <div className="aspect-video">
-                      <img 
-                        src={highlight.image_url} 
-                        alt={highlight.title}
-                        className="w-full h-full object-cover rounded-t-lg"
-                      />
+                      <picture className="contents">
+                        {highlight.image_srcset?.webp && (
+                          <source type="image/webp" srcSet={highlight.image_srcset.webp} sizes="(min-width: 768px) 33vw, 100vw" />
+                        )}
+                        <img 
+                          src={highlight.image_url} 
+                          srcSet={highlight.image_srcset?.jpeg}
+                          sizes="(min-width: 768px) 33vw, 100vw"
+                          alt={highlight.title}
+                          className="w-full h-full object-cover rounded-t-lg"
+                        />
+                      </picture>
                     </div>
                   )}
                   <CardContent className="p-6">
@@ -2859,40 +2873,78 @@ const PublicationsManagementPanel = () => {
           <Card>
             <CardHeader>
               <CardTitle>Upload EndNote Publications</CardTitle>
-              <CardDescription>Upload RIS file from EndNote to populate static publications</CardDescription>
+              <CardDescription>Upload a RIS, BibTeX or CSL-JSON file to populate static publications</CardDescription>
             </CardHeader>
             <CardContent>
               <input 
                 type="file" 
-                accept=".ris" 
+                accept=".ris,.bib,.json" 
                 onChange={async (e) => {
                   const file = e.target.files[0];
                   if (!file) return;
                   
+                  const uploadPaths = { ris: 'ris', bib: 'bibtex', json: 'csl-json' };
+                  const uploadPath = uploadPaths[file.name.split('.').pop().toLowerCase()];
+                  if (!uploadPath) {
+                    toast.error('File must be a RIS (.ris), BibTeX (.bib) or CSL-JSON (.json) file');
+                    return;
+                  }
+                  
                   const formData = new FormData();
                   formData.append('file', file);
                   
                   try {
                     const token = localStorage.getItem('token');
-                    const response = await axios.post(`${API}/upload/ris`, formData, {
-                      headers: {
-                        'Authorization': `Bearer ${token}`
+                    const headers = { 'Authorization': `Bearer ${token}` };
+                    const response = await axios.post(`${API}/upload/${uploadPath}`, formData, { headers });
+                    e.target.value = '';
+                    toast.info(response.data.message);
+                    
+                    // The import runs in the background; poll the job until it finishes, giving up
+                    // after 30 minutes or after several failed polls in a row
+                    let job = { status: 'queued' };
+                    let failedPolls = 0;
+                    const deadline = Date.now() + 30 * 60 * 1000;
+                    while ((job.status === 'queued' || job.status === 'running') && Date.now() < deadline) {
+                      await new Promise(resolve => setTimeout(resolve, 2000));
+                      try {
+                        job = (await axios.get(`${API}/admin/import-jobs/${response.data.job_id}`, { headers })).data;
+                        failedPolls = 0;
+                      } catch (pollError) {
+                        failedPolls += 1;
+                        if (failedPolls >= 5) throw pollError;
                       }
-                    });
-                    toast.success(response.data.message);
+                    }
+                    if (job.status === 'queued' || job.status === 'running') {
+                      toast.warning('Import is still running. Check the publications list again later.');
+                    } else if (job.status === 'completed') {
+                      toast.success(`Imported ${job.inserted} new publications (${job.matched} already present, ${job.skipped} skipped)`);
+                      if (job.possible_duplicates) {
+                        toast.warning(`${job.possible_duplicates} imported publications look like near-duplicates of existing ones`);
+                      }
+                    } else {
+                      toast.error(`Import failed: ${job.errors?.[job.errors.length - 1] || 'unknown error'}`);
+                    }
                     // Refresh publications list
                     fetchStaticPublications();
-                    e.target.value = '';
                   } catch (error) {
-                    console.error('RIS upload error:', error);
-                    toast.error(error.response?.data?.detail || 'Error uploading RIS file');
+                    console.error('Publication upload error:', error);
+                    toast.error(error.response?.data?.detail || 'Error uploading publications file');
                   }
                 }}
                 className="w-full p-3 border border-dashed border-gray-300 rounded-lg cursor-pointer hover:border-gray-400"
               />
               <p className="text-sm text-gray-500 mt-2">
-                Export your EndNote library as RIS format and upload here. Duplicates (same title and year) will be automatically skipped.
+                Export your EndNote library as RIS format (or your reference manager library as BibTeX or CSL-JSON) and upload here. Duplicates (same title and year, ignoring case and punctuation, or same DOI) will be automatically skipped.
               </p>
+              <div className="flex gap-4 mt-4">
+                <a href={`${API}/static-publications/export?format=bibtex`} className="text-sm text-blue-600 hover:underline">
+                  Download all as BibTeX
+                </a>
+                <a href={`${API}/static-publications/export?format=csl-json`} className="text-sm text-blue-600 hover:underline">
+                  Download all as CSL-JSON
+                </a>
+              </div>
             </CardContent>
           </Card>
 
@@ -205,11 +205,18 @@ const NewsPage = () => {
               <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
                 {article.image_url && (
                   <div className="md:col-span-1">
-                    <img 
-                      src={article.image_url} 
-                      alt={article.title}
-                      className="w-full h-48 md:h-full object-cover rounded-l-lg"
-                    />
+                    <picture className="contents">
+                      {article.image_srcset?.webp && (
+                        <source type="image/webp" srcSet={article.image_srcset.webp} sizes="(min-width: 768px) 33vw, 100vw" />
+                      )}
+                      <img 
+                        src={article.image_url} 
+                        srcSet={article.image_srcset?.jpeg}
+                        sizes="(min-width: 768px) 33vw, 100vw"
+                        alt={article.title}
+                        className="w-full h-48 md:h-full object-cover rounded-l-lg"
+                      />
+                    </picture>
                   </div>
                 )}
                 <div className={`${article.image_url ? 'md:col-span-2' : 'md:col-span-3'}`}>
@@ -96,11 +96,18 @@ const ResearchPage = () => {
               <Card key={area.id} className="hover:shadow-lg transition-shadow">
                 {area.image_url && (
                   <div className="w-full h-48 overflow-hidden">
-                    <img 
-                      src={area.image_url} 
-                      alt={area.title}
-                      className="w-full h-full object-cover"
-                    />
+                    <picture className="contents">
+                      {area.image_srcset?.webp && (
+                        <source type="image/webp" srcSet={area.image_srcset.webp} sizes="(min-width: 768px) 50vw, 100vw" />
+                      )}
+                      <img 
+                        src={area.image_url} 
+                        srcSet={area.image_srcset?.jpeg}
+                        sizes="(min-width: 768px) 50vw, 100vw"
+                        alt={area.title}
+                        className="w-full h-full object-cover"
+                      />
+                    </picture>
                   </div>
                 )}
                 <CardHeader>
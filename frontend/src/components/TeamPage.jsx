@@ -12,6 +12,7 @@ const API = `${BACKEND_URL}/api`;
 const TeamPage = () => {
   const [team, setTeam] = useState([]);
   const [settings, setSettings] = useState({});
+  const [metrics, setMetrics] = useState({});
   const [loading, setLoading] = useState(true);
   const [activeTab, setActiveTab] = useState('principal');
 
@@ -31,7 +32,18 @@ const TeamPage = () => {
       }
     };
 
+    // Metrics are optional: members still render if the citation sources are slow or down
+    const fetchMetrics = async () => {
+      try {
+        const metricsRes = await axios.get(`${API}/team/metrics`);
+        setMetrics(Object.fromEntries(metricsRes.data.map(m => [m.member_id, m])));
+      } catch (error) {
+        console.error('Error fetching team metrics:', error);
+      }
+    };
+
     fetchTeam();
+    fetchMetrics();
   }, []);
 
   // Separate principal, active members, collaborators and alumni
@@ -77,11 +89,18 @@ const TeamPage = () => {
       <CardHeader className="text-center">
         <div className="relative mb-4">
           {member.photo_url ? (
-            <img 
-              src={member.photo_url} 
-              alt={member.name}
-              className="w-24 h-24 mx-auto rounded-full object-cover"
-            />
+            <picture className="contents">
+              {member.photo_srcset?.webp && (
+                <source type="image/webp" srcSet={member.photo_srcset.webp} sizes="96px" />
+              )}
+              <img 
+                src={member.photo_url} 
+                srcSet={member.photo_srcset?.jpeg}
+                sizes="96px"
+                alt={member.name}
+                className="w-24 h-24 mx-auto rounded-full object-cover"
+              />
+            </picture>
           ) : (
             <div className="w-24 h-24 mx-auto bg-gradient-to-br from-blue-500 to-cyan-500 rounded-full flex items-center justify-center">
               <User className="w-12 h-12 text-white" />
@@ -129,6 +148,23 @@ const TeamPage = () => {
           </div>
         )}
         
+        {metrics[member.id] && (
+          <div className="grid grid-cols-3 gap-2 mb-4 text-center">
+            <div>
+              <div className="font-semibold">{metrics[member.id].total_citations.toLocaleString()}</div>
+              <div className="text-xs text-gray-500">Citations</div>
+            </div>
+            <div>
+              <div className="font-semibold">{metrics[member.id].h_index}</div>
+              <div className="text-xs text-gray-500">h-index</div>
+            </div>
+            <div>
+              <div className="font-semibold">{metrics[member.id].i10_index ?? '—'}</div>
+              <div className="text-xs text-gray-500">i10-index</div>
+            </div>
+          </div>
+        )}
+        
         <div className="space-y-2">
           <div className="flex items-center space-x-2">
             <Mail className="w-4 h-4 text-gray-400" />
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Scraper Benchmark
+- parse:  CPU time per parse and parse throughput for the saved Google Scholar and Scopus HTML
+          fixtures (tests/fixtures), previous full html.parser tree vs the lxml + SoupStrainer
+          parsers used by backend/server.py
+- replay: end-to-end latency of the Scholar and Scopus fetchers against the local replay stub
+          server (scraper_stub_server.py), clean and with injected 429s and timeouts
+
+Usage: python scraper_benchmark.py [parse|replay]   (runs both by default, no network needed)
+"""
+
+import asyncio
+import contextlib
+import io
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from scraper_stub_server import FaultInjection, start_stub_server
+
+ROOT_DIR = Path(__file__).parent
+FIXTURES_DIR = ROOT_DIR / 'tests' / 'fixtures'
+
+ITERATIONS = int(os.environ.get('BENCHMARK_ITERATIONS', '50'))
+REPLAY_CALLS = int(os.environ.get('BENCHMARK_REPLAY_CALLS', '20'))
+STUB_PORT = int(os.environ.get('BENCHMARK_STUB_PORT', '8765'))
+STUB_URL = f"http://127.0.0.1:{STUB_PORT}"
+
+# server.py connects to MongoDB lazily, so placeholder settings are enough to import it.
+# The fetchers are pointed at the stub server, with short timeouts and backoff so that
+# injected faults cost benchmark seconds rather than minutes.
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'scraper_benchmark')
+os.environ.setdefault('SCOPUS_API_KEY', 'replay')
+for name in ('SCHOLAR_BASE_URL', 'SCOPUS_WEB_BASE_URL', 'ELSEVIER_API_BASE_URL'):
+    os.environ.setdefault(name, STUB_URL)
+os.environ.setdefault('SCHOLAR_TIMEOUT_SECONDS', '1')
+os.environ.setdefault('SCOPUS_TIMEOUT_SECONDS', '1')
+os.environ.setdefault('SCHOLAR_BACKOFF_BASE_SECONDS', '0.05')
+os.environ.setdefault('SCOPUS_BACKOFF_BASE_SECONDS', '0.05')
+sys.path.insert(0, str(ROOT_DIR / 'backend'))
+import server  # noqa: E402
+
+# Keep the report readable: the fetchers log every request and fallback
+logging.getLogger().setLevel(logging.CRITICAL)
+
+SCOPUS_AUTHOR_ID = '22133247800'
+
+def legacy_parse_scholar(html: bytes):
+    """Previous approach: build the full page tree with html.parser"""
+    soup = BeautifulSoup(html, 'html.parser')
+    return soup.find('table', {'id': 'gsc_rsb_st'})
+
+def legacy_parse_scopus(html: bytes):
+    """Previous approach: build the full page tree with html.parser"""
+    soup = BeautifulSoup(html, 'html.parser')
+    return soup.find_all('tr', class_='searchArea') or soup.find_all('div', class_='documentDataCol')
+
+def cpu_ms_per_parse(parse, html: bytes) -> float:
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        parse(html)
+    return (time.process_time() - start) * 1000 / ITERATIONS
+
+def run_parse_benchmark():
+    print("🧪 Scraper Parse Benchmark")
+    print("=" * 60)
+    print(f"Iterations per parser: {ITERATIONS}")
+
+    cases = [
+        ('Google Scholar', 'scholar_profile.html', legacy_parse_scholar, server.parse_scholar_metrics),
+        ('Scopus profile', 'scopus_author_profile.html', legacy_parse_scopus, lambda html: server.parse_scopus_profile(html, 50)),
+    ]
+
+    for name, fixture, legacy_parse, fast_parse in cases:
+        html = (FIXTURES_DIR / fixture).read_bytes()
+        result = fast_parse(html)
+        if not result:
+            print(f"❌ {name}: fast parser returned no data for {fixture}")
+            continue
+
+        before = cpu_ms_per_parse(legacy_parse, html)
+        after = cpu_ms_per_parse(fast_parse, html)
+        print(f"\n{name} ({fixture}, {len(html) / 1024:.0f} KB)")
+        print(f"   html.parser full tree:  {before:8.2f} ms CPU/parse")
+        print(f"   lxml + SoupStrainer:    {after:8.2f} ms CPU/parse")
+        print(f"   Speedup:                {before / after:8.1f}x")
+        print(f"   Throughput:             {1000 / after:8.1f} pages/s ({len(html) / 1024 / 1024 * 1000 / after:.1f} MB/s)")
+
+def percentile(values, pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+async def time_calls(call, is_live):
+    """Run a fetcher REPLAY_CALLS times; return latencies (ms) and how many calls got live data"""
+    latencies = []
+    live = 0
+    for _ in range(REPLAY_CALLS):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = await call()
+        latencies.append((time.perf_counter() - start) * 1000)
+        if is_live(result):
+            live += 1
+    return latencies, live
+
+def is_live_scopus(publications) -> bool:
+    # Mock fallback records carry placeholder IDs
+    return bool(publications) and not publications[0].get('scopus_id', '').startswith('SCOPUS_ID_')
+
+async def run_replay_benchmark():
+    print("\n🧪 Scraper Replay Benchmark")
+    print("=" * 60)
+    print(f"Stub server: {STUB_URL}, calls per fetcher: {REPLAY_CALLS}")
+    print(f"Client timeouts: Scholar {server.SCHOLAR_TIMEOUT_SECONDS}s, Scopus {server.SCOPUS_TIMEOUT_SECONDS}s")
+
+    faults = FaultInjection(timeout_delay=max(server.SCHOLAR_TIMEOUT_SECONDS, server.SCOPUS_TIMEOUT_SECONDS) + 0.5)
+    httpd = start_stub_server(faults, port=STUB_PORT)
+
+    scenarios = [
+        ('clean', 0, 0),
+        ('30% 429s', 0.3, 0),
+        ('15% timeouts', 0, 0.15),
+    ]
+    fetchers = [
+        ('Google Scholar scrape', lambda: server.scrape_google_scholar_metrics(server.SCHOLAR_PROFILE_ID), lambda data: data is not None),
+        ('Scopus profile + API fallback', lambda: server.fetch_scopus_publications_api(SCOPUS_AUTHOR_ID, 10), is_live_scopus),
+        ('Scopus Search API fallback', lambda: server.fetch_scopus_api_fallback(SCOPUS_AUTHOR_ID, 25), is_live_scopus),
+        ('Scopus full bibliography', lambda: server.ingest_scopus_bibliography(SCOPUS_AUTHOR_ID), lambda result: result[1]),
+    ]
+
+    try:
+        for scenario, rate_limit_ratio, timeout_ratio in scenarios:
+            faults.rate_limit_ratio = rate_limit_ratio
+            faults.timeout_ratio = timeout_ratio
+            faults.reset_counts()
+            server.scholar_breaker.record_success()
+
+            print(f"\n{scenario}")
+            for name, call, is_live in fetchers:
+                latencies, live = await time_calls(call, is_live)
+                print(f"   {name:30} p50 {percentile(latencies, 50):8.1f} ms   p95 {percentile(latencies, 95):8.1f} ms   "
+                      f"max {max(latencies):8.1f} ms   live {live}/{REPLAY_CALLS}")
+            print(f"   Stub requests: {faults.requests} ({faults.rate_limited} answered 429, {faults.timed_out} stalled)")
+            if server.scholar_breaker.is_open():
+                print("   ⚠️  Google Scholar circuit breaker opened during this scenario")
+    finally:
+        httpd.shutdown()
+        await server.get_http_client().aclose()
+
+if __name__ == "__main__":
+    mode = sys.argv[1] if len(sys.argv) > 1 else 'all'
+    if mode in ('parse', 'all'):
+        run_parse_benchmark()
+    if mode in ('replay', 'all'):
+        asyncio.run(run_replay_benchmark())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Scraper Replay Stub Server
+Serves the recorded Google Scholar, Scopus and Elsevier API fixtures (tests/fixtures) over
+local HTTP, with optional injected latency, 429 responses and slow (timing out) responses.
+Point backend/server.py at it with SCHOLAR_BASE_URL, SCOPUS_WEB_BASE_URL and ELSEVIER_API_BASE_URL.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+FIXTURES_DIR = Path(__file__).parent / 'tests' / 'fixtures'
+
+class FaultInjection:
+    """Fault settings shared by all request handlers (changeable while the server runs)"""
+
+    def __init__(self, latency_ms: float = 0, rate_limit_ratio: float = 0, timeout_ratio: float = 0, timeout_delay: float = 2):
+        self.latency_ms = latency_ms
+        self.rate_limit_ratio = rate_limit_ratio
+        self.timeout_ratio = timeout_ratio
+        self.timeout_delay = timeout_delay
+        self.requests = 0
+        self.rate_limited = 0
+        self.timed_out = 0
+        self.lock = threading.Lock()
+
+    def reset_counts(self):
+        with self.lock:
+            self.requests = self.rate_limited = self.timed_out = 0
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    faults = FaultInjection()
+    scholar_html = b''
+    scopus_html = b''
+    search_entries = []
+    author_metrics = b''
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        faults = self.faults
+        roll = random.random()
+        with faults.lock:
+            faults.requests += 1
+            if roll < faults.rate_limit_ratio:
+                faults.rate_limited += 1
+            elif roll < faults.rate_limit_ratio + faults.timeout_ratio:
+                faults.timed_out += 1
+
+        if faults.latency_ms:
+            time.sleep(faults.latency_ms / 1000)
+        if roll < faults.rate_limit_ratio:
+            return self.send_body(429, b'Too Many Requests', 'text/plain')
+        if roll < faults.rate_limit_ratio + faults.timeout_ratio:
+            # Respond only after the client has given up
+            time.sleep(faults.timeout_delay)
+
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == '/citations':
+            return self.send_body(200, self.scholar_html, 'text/html; charset=utf-8')
+        if url.path == '/authid/detail.uri':
+            return self.send_body(200, self.scopus_html, 'text/html; charset=utf-8')
+        if url.path == '/content/search/scopus':
+            start = int(query.get('start', ['0'])[0])
+            count = int(query.get('count', ['25'])[0])
+            page = {'search-results': {
+                'opensearch:totalResults': str(len(self.search_entries)),
+                'opensearch:startIndex': str(start),
+                'opensearch:itemsPerPage': str(count),
+                'entry': self.search_entries[start:start + count]
+            }}
+            return self.send_body(200, json.dumps(page).encode(), 'application/json')
+        if url.path.startswith('/content/author/author_id/'):
+            return self.send_body(200, self.author_metrics, 'application/json')
+        self.send_body(404, b'Not Found', 'text/plain')
+
+    def send_body(self, status: int, body: bytes, content_type: str):
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client timed out and closed the connection
+            pass
+
+def load_fixtures():
+    ReplayHandler.scholar_html = (FIXTURES_DIR / 'scholar_profile.html').read_bytes()
+    ReplayHandler.scopus_html = (FIXTURES_DIR / 'scopus_author_profile.html').read_bytes()
+    search = json.loads((FIXTURES_DIR / 'scopus_search_results.json').read_text())
+    ReplayHandler.search_entries = search['search-results']['entry']
+    ReplayHandler.author_metrics = (FIXTURES_DIR / 'scopus_author_metrics.json').read_bytes()
+
+def start_stub_server(faults: FaultInjection, host: str = '127.0.0.1', port: int = 0) -> ThreadingHTTPServer:
+    """Start the stub server in a background thread (port 0 picks a free port)"""
+    load_fixtures()
+    ReplayHandler.faults = faults
+    httpd = ThreadingHTTPServer((host, port), ReplayHandler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Serve recorded scraper fixtures locally')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--rate-limit', type=float, default=0, help='fraction of requests answered with 429')
+    parser.add_argument('--timeouts', type=float, default=0, help='fraction of requests delayed past the client timeout')
+    parser.add_argument('--timeout-delay', type=float, default=20, help='seconds to stall a timed out request')
+    args = parser.parse_args()
+
+    httpd = start_stub_server(FaultInjection(args.latency_ms, args.rate_limit, args.timeouts, args.timeout_delay), port=args.port)
+    base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    print(f"🚀 Replay stub server listening on {base_url}")
+    print(f"   SCHOLAR_BASE_URL={base_url} SCOPUS_WEB_BASE_URL={base_url} ELSEVIER_API_BASE_URL={base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        httpd.shutdown()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Background Job Tests
+Stale import/maintenance jobs in backend/server.py being failed by the heartbeat sweep,
+against an in-memory MongoDB (mongomock_motor).
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+# server.py connects to MongoDB lazily, so placeholder settings are enough to import it
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'background_job_tests')
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+import server  # noqa: E402
+
+@pytest.fixture
+def db(monkeypatch):
+    database = AsyncMongoMockClient()['background_job_tests']
+    monkeypatch.setattr(server, 'db', database)
+    return database
+
+def job(job_id: str, status: str = 'running', owner: str = 'other-worker', heartbeat_minutes_ago=None, updated_minutes_ago: float = 0) -> dict:
+    now = datetime.now(timezone.utc)
+    doc = {'id': job_id, 'status': status, 'owner': owner, 'errors': [], 'updated_at': now - timedelta(minutes=updated_minutes_ago)}
+    if heartbeat_minutes_ago is not None:
+        doc['heartbeat_at'] = now - timedelta(minutes=heartbeat_minutes_ago)
+    return doc
+
+def statuses(db, collection_name: str) -> dict:
+    async def collect():
+        return {doc['id']: doc['status'] async for doc in db[collection_name].find()}
+    return asyncio.run(collect())
+
+def test_jobs_without_recent_heartbeat_are_failed(db):
+    stale = server.IMPORT_JOB_STALE_MINUTES + 1
+    asyncio.run(db.import_jobs.insert_many([
+        job('stale-running', heartbeat_minutes_ago=stale),
+        job('stale-queued', status='queued', heartbeat_minutes_ago=stale),
+        job('alive', heartbeat_minutes_ago=0),
+        job('finished', status='completed', heartbeat_minutes_ago=stale),
+    ]))
+    asyncio.run(server.fail_stale_jobs())
+    assert statuses(db, 'import_jobs') == {
+        'stale-running': 'failed', 'stale-queued': 'failed', 'alive': 'running', 'finished': 'completed'
+    }
+    failed = asyncio.run(db.import_jobs.find_one({'id': 'stale-running'}))
+    assert failed['errors'] == ['Interrupted by a server restart']
+    assert failed['finished_at'] is not None
+
+def test_own_jobs_are_never_failed(db):
+    asyncio.run(db.import_jobs.insert_one(job('mine', owner=server.WORKER_ID, heartbeat_minutes_ago=60)))
+    asyncio.run(server.fail_stale_jobs())
+    assert statuses(db, 'import_jobs') == {'mine': 'running'}
+
+def test_legacy_jobs_fall_back_to_updated_at(db):
+    stale = server.IMPORT_JOB_STALE_MINUTES + 1
+    asyncio.run(db.import_jobs.insert_many([
+        job('legacy-stale', updated_minutes_ago=stale),
+        job('legacy-recent', updated_minutes_ago=0),
+    ]))
+    asyncio.run(server.fail_stale_jobs())
+    assert statuses(db, 'import_jobs') == {'legacy-stale': 'failed', 'legacy-recent': 'running'}
+
+def test_maintenance_jobs_are_swept_too(db):
+    asyncio.run(db.maintenance_jobs.insert_one(job('cleanup', heartbeat_minutes_ago=server.IMPORT_JOB_STALE_MINUTES + 1)))
+    asyncio.run(server.fail_stale_jobs())
+    assert statuses(db, 'maintenance_jobs') == {'cleanup': 'failed'}
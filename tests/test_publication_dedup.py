@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Publication Dedup Tests
+Title/DOI normalisation behind the dedup_key index and MinHash/LSH near-duplicate detection
+in backend/server.py, against an in-memory MongoDB (mongomock_motor) where one is needed.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+# server.py connects to MongoDB lazily, so placeholder settings are enough to import it
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'publication_dedup_tests')
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+import server  # noqa: E402
+
+def test_dedup_key_ignores_case_punctuation_and_spacing():
+    a = {'title': 'Heavy Metals: A Review.', 'year': 2020}
+    b = {'title': '  heavy   metals a review ', 'year': 2020}
+    assert server.publication_dedup_key(a) == server.publication_dedup_key(b) == 'heavy metals a review|2020'
+
+def test_dedup_key_unifies_unicode_dashes_and_compatibility_forms():
+    a = {'title': 'Long‐term – monitoring', 'year': 2019}
+    b = {'title': 'long-term - monitoring', 'year': 2019}
+    c = {'title': 'Ｌｏｎｇ－term monitoring', 'year': 2019}
+    assert server.publication_dedup_key(a) == server.publication_dedup_key(b) == server.publication_dedup_key(c)
+
+def test_dedup_key_keeps_years_apart():
+    assert server.publication_dedup_key({'title': 'Same', 'year': 2020}) != server.publication_dedup_key({'title': 'Same', 'year': 2021})
+    assert server.publication_dedup_key({'title': 'Same'}) == server.publication_dedup_key({'title': 'Same', 'year': None}) == 'same|0'
+
+def test_normalize_doi_strips_resolver_prefixes():
+    expected = '10.1000/abc.def'
+    for doi in ['10.1000/ABC.def', ' https://doi.org/10.1000/abc.def', 'http://dx.doi.org/10.1000/abc.def', 'doi: 10.1000/abc.def']:
+        assert server.normalize_doi(doi) == expected
+    assert server.normalize_doi(None) == ''
+
+STORED = {'id': 'p1', 'title': 'Heavy metal contamination in river sediments of the Ganges basin', 'authors': 'Smith, J.; Kumar, A.'}
+OTHER = {'id': 'p2', 'title': 'Microplastics in coastal waters of Kerala', 'authors': 'Smith, J.; Kumar, A.'}
+
+@pytest.fixture
+def db(monkeypatch):
+    database = AsyncMongoMockClient()['publication_dedup_tests']
+    monkeypatch.setattr(server, 'db', database)
+    asyncio.run(database.static_publications.insert_many([
+        {**pub, **server.near_duplicate_fields(pub)} for pub in (STORED, OTHER)
+    ]))
+    return database
+
+def near_duplicates(*titles) -> dict:
+    records = [server.near_duplicate_fields({'title': title, 'authors': STORED['authors']}) for title in titles]
+    return asyncio.run(server.find_near_duplicates(records))
+
+def test_signature_similarity_estimates_jaccard():
+    a = server.publication_features(STORED)
+    b = server.publication_features({**STORED, 'title': STORED['title'].replace('sediments', 'sediment')})
+    estimate = server.signature_similarity(server.minhash_signature(a), server.minhash_signature(b))
+    assert abs(estimate - len(a & b) / len(a | b)) < 0.1
+
+def test_near_duplicates_match_above_threshold_only(db):
+    matches = near_duplicates(
+        STORED['title'],
+        STORED['title'].replace('sediments', 'sediment'),
+        'Groundwater arsenic in Bangladesh'
+    )
+    assert matches[0] == ('p1', 1.0)
+    assert matches[1][0] == 'p1' and server.NEAR_DUPLICATE_THRESHOLD <= matches[1][1] < 1.0
+    assert 2 not in matches
+
+def test_stricter_threshold_keeps_only_exact_matches(db, monkeypatch):
+    monkeypatch.setattr(server, 'NEAR_DUPLICATE_THRESHOLD', 0.99)
+    matches = near_duplicates(STORED['title'], STORED['title'].replace('sediments', 'sediment'))
+    assert list(matches) == [0]
+
+def test_shared_authors_alone_are_not_near_duplicates(db):
+    assert near_duplicates('Microplastics in estuaries of Goa') == {}
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Publication Import Format Tests
+Streaming RIS, CSL-JSON and BibTeX parsers in backend/server.py, read in small chunks so
+items and entries are split across reads. No database or network needed.
+"""
+
+import asyncio
+import io
+import os
+import sys
+from pathlib import Path
+
+from fastapi import UploadFile
+
+# server.py connects to MongoDB lazily, so placeholder settings are enough to import it
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'publication_format_tests')
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+import server  # noqa: E402
+
+def parse(iter_records, text: str, chunk_bytes: int = 7):
+    """Run a streaming parser over text; return (titles, errors)"""
+    async def collect():
+        errors = []
+        upload = UploadFile(file=io.BytesIO(text.encode()), filename='upload')
+        return [pub['title'] async for pub in iter_records(upload, errors)], errors
+
+    original = server.RIS_READ_CHUNK_BYTES
+    server.RIS_READ_CHUNK_BYTES = chunk_bytes
+    try:
+        return asyncio.run(collect())
+    finally:
+        server.RIS_READ_CHUNK_BYTES = original
+
+def test_ris_records_split_across_chunks():
+    text = ('\ufeffTY  - JOUR\r\nTI  - Heavy metals – in rivers\r\nPY  - 2020\r\nER  - \r\n'
+            'TY  - BOOK\nTI  - Second\nER  - \n'
+            'TY  - JOUR\nAU  - No title\nER  - \n')
+    titles, errors = parse(server.iter_ris_records, text)
+    assert titles == ['Heavy metals – in rivers', 'Second']
+    assert errors == []
+
+def test_ris_record_without_end_tag_at_end_of_file():
+    titles, _ = parse(server.iter_ris_records, 'TY  - JOUR\nTI  - Done\nER  - \nTY  - JOUR\nTI  - Unfinished\n')
+    assert titles == ['Done']
+
+def test_csl_json_skips_malformed_item_and_keeps_parsing():
+    titles, errors = parse(server.iter_csl_json_records, '[{"title":"A"}, {"title": bad}, {"title":"C"}]')
+    assert titles == ['A', 'C']
+    assert len(errors) == 1 and errors[0].startswith('Item 2:')
+
+def test_csl_json_malformed_item_with_nested_values():
+    text = '[{"title":"A"}, {"title": "x", "author": [{"family": "}"}], oops}, {"title":"C"}]'
+    titles, errors = parse(server.iter_csl_json_records, text)
+    assert titles == ['A', 'C']
+    assert len(errors) == 1
+
+def test_csl_json_oversized_malformed_item_is_not_buffered(monkeypatch):
+    monkeypatch.setattr(server, 'CSL_MAX_ITEM_CHARS', 64)
+    text = '[{"title": bad, "abstract": "' + 'x' * 1000 + '"}, {"title":"C"}]'
+    titles, errors = parse(server.iter_csl_json_records, text, chunk_bytes=16)
+    assert titles == ['C']
+    assert len(errors) == 1
+
+def test_csl_json_truncated_array():
+    titles, errors = parse(server.iter_csl_json_records, '[{"title":"A"}, {"title":"B"')
+    assert titles == ['A']
+    assert errors[-1] == 'File ends before the closing ] of the CSL-JSON array'
+
+def test_bibtex_entries_split_across_chunks():
+    text = '@string{foo = "x"}\n@article{a, title = {Heavy {Metals} \\& Rivers}, year = 2020}\n@misc{b, title = "Two"}'
+    titles, errors = parse(server.iter_bibtex_records, text)
+    assert titles == ['Heavy Metals & Rivers', 'Two']
+    assert errors == []
+
+def test_bibtex_paren_delimited_entries():
+    text = '@article(a, title = {Metals (and more)}, note = "a ) b", year = 2020)\n@misc{b, title = {Two}}'
+    titles, errors = parse(server.iter_bibtex_records, text)
+    assert titles == ['Metals (and more)', 'Two']
+    assert errors == []
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Scopus Ingest Retry Tests
+Paging in the Scopus bibliography ingest with the search page fetch replaced by a fake,
+so 429s and failed pages can be injected. No database or network needed.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import httpx
+
+# server.py connects to MongoDB lazily, so placeholder settings are enough to import it
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'scopus_ingest_tests')
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+import server  # noqa: E402
+
+TOTAL = 6
+
+def rate_limited(retry_after: str = None) -> httpx.HTTPStatusError:
+    headers = {'Retry-After': retry_after} if retry_after else {}
+    request = httpx.Request('GET', server.SCOPUS_SEARCH_URL)
+    response = httpx.Response(429, headers=headers, request=request)
+    return httpx.HTTPStatusError('429 Too Many Requests', request=request, response=response)
+
+def fake_pages(failures: dict):
+    """Fake page fetch that raises failures[start] (a list of errors) before answering"""
+    async def fetch(author_id, start, count):
+        if failures.get(start):
+            raise failures[start].pop(0)
+        entries = [
+            {'dc:title': f'Paper {i}', 'dc:identifier': f'SCOPUS_ID:{i}', 'prism:coverDate': '2020-01-01'}
+            for i in range(start, start + count)
+        ]
+        return {'opensearch:totalResults': str(TOTAL), 'entry': entries}
+    return fetch
+
+def ingest(monkeypatch, failures: dict):
+    """Run the ingest over TOTAL results in pages of 2; return (titles, complete, sleeps)"""
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setenv('SCOPUS_API_KEY', 'test')
+    monkeypatch.setattr(server, 'SCOPUS_PAGE_SIZE', 2)
+    monkeypatch.setattr(server, 'fetch_scopus_search_page', fake_pages(failures))
+    monkeypatch.setattr(server.asyncio, 'sleep', fake_sleep)
+    publications, complete = asyncio.run(server._ingest_scopus_bibliography('123'))
+    return sorted(pub['title'] for pub in publications), complete, sleeps
+
+def test_rate_limited_pages_are_retried(monkeypatch):
+    titles, complete, sleeps = ingest(monkeypatch, {2: [rate_limited(), rate_limited()]})
+    assert titles == [f'Paper {i}' for i in range(TOTAL)]
+    assert complete
+    assert len(sleeps) == 2
+
+def test_retry_after_header_is_honoured(monkeypatch):
+    _, complete, sleeps = ingest(monkeypatch, {4: [rate_limited('7')]})
+    assert complete
+    assert sleeps == [7.0]
+
+def test_page_failing_after_retries_keeps_other_pages(monkeypatch):
+    failures = {2: [rate_limited() for _ in range(server.SCOPUS_PAGE_RETRIES + 1)]}
+    titles, complete, _ = ingest(monkeypatch, failures)
+    assert titles == ['Paper 0', 'Paper 1', 'Paper 4', 'Paper 5']
+    assert not complete
+
+def test_client_errors_are_not_retried(monkeypatch):
+    request = httpx.Request('GET', server.SCOPUS_SEARCH_URL)
+    forbidden = httpx.HTTPStatusError('403', request=request, response=httpx.Response(403, request=request))
+    titles, complete, sleeps = ingest(monkeypatch, {0: [forbidden]})
+    assert titles == [] and not complete
+    assert sleeps == []